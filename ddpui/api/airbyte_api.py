@@ -1,4 +1,6 @@
-from typing import List, Dict, Any, Optional, Union, Tuple, cast
+from functools import wraps
+from celery.result import AsyncResult
+from typing import List, Dict, Any, Optional, Union, Tuple, Callable, cast
 from pydantic import BaseModel, Field
 from django.http import JsonResponse
 from rest_framework.request import Request
@@ -8,6 +10,7 @@ from ddpui.models.airbyte_sync import AirbyteSync, AirbyteSyncRun
 from ddpui.models.warehouse import WarehouseCredential
 from ddpui.models.credentials import DataSourceCredential
 from ddpui.ddpairbyte.airbyte_service import AirbyteService
+from ddpui.celeryworkers.tasks import trigger_airbyte_sync
 from ddpui.utils.custom_logger import CustomLogger
 
 logger = CustomLogger("airbyte_api")
@@ -104,62 +107,106 @@ class JobStatusResponse(BaseModel):
     status: str
     logs: Optional[Dict[str, Any]] = None
 
-def get_source_definitions(request: Request, orgid: str) -> JsonResponse:
+def get_request_org(request: Request, orgid: str) -> Org:
     """
-    Get all source definitions from Airbyte.
+    Get the organization with the given ID, reusing the one the auth middleware already
+    attached to the request if it is the same.
     
     Args:
         request: The HTTP request object
         orgid: The organization ID
         
+    Returns:
+        The organization
+        
+    Raises:
+        Org.DoesNotExist: If there is no such organization, or the user has none
+    """
+    orguser = getattr(request, "orguser", None)
+    if orguser is not None and orguser.org is None:
+        raise Org.DoesNotExist("the user does not belong to an organization")
+    if orguser is not None and str(orguser.org.id) == str(orgid):
+        return orguser.org
+    return Org.objects.get(id=orgid)
+
+def require_airbyte_service(endpoint: Callable[..., JsonResponse]) -> Callable[..., JsonResponse]:
+    """
+    Look up the organization and its Airbyte service, and pass the service to the endpoint
+    in place of the organization ID.
+    
+    Args:
+        endpoint: The endpoint taking (request, airbyte_service, ...)
+        
+    Returns:
+        The endpoint taking (request, orgid, ...)
+    """
+    @wraps(endpoint)
+    def wrapper(request: Request, orgid: str, *args: Any, **kwargs: Any) -> JsonResponse:
+        try:
+            airbyte_service: AirbyteService = AirbyteService(get_request_org(request, orgid))
+        except Org.DoesNotExist as e:
+            logger.error(f"{endpoint.__name__}: {str(e)}")
+            return JsonResponse({"error": "organization not found"}, status=400)
+        except Exception as e:
+            logger.error(f"{endpoint.__name__}: {str(e)}")
+            return JsonResponse({"error": str(e)}, status=500)
+        return endpoint(request, airbyte_service, *args, **kwargs)
+    
+    return wrapper
+
+@require_airbyte_service
+def get_source_definitions(request: Request, airbyte_service: AirbyteService) -> JsonResponse:
+    """
+    Get all source definitions from Airbyte.
+    
+    Args:
+        request: The HTTP request object
+        airbyte_service: The Airbyte service of the organization
+        
     Returns:
         JsonResponse containing list of source definitions
     """
     try:
-        org: Org = Org.objects.get(id=orgid)
-        airbyte_service: AirbyteService = AirbyteService(org)
         source_definitions: List[Dict[str, Any]] = airbyte_service.list_source_definitions()
         return JsonResponse({"source_definitions": source_definitions})
     except Exception as e:
         logger.error(f"get_source_definitions: {str(e)}")
         return JsonResponse({"error": str(e)}, status=500)
 
-def get_source_definition_specifications(request: Request, orgid: str, source_definition_id: str) -> JsonResponse:
+@require_airbyte_service
+def get_source_definition_specifications(request: Request, airbyte_service: AirbyteService, source_definition_id: str) -> JsonResponse:
     """
     Get specifications for a specific source definition.
     
     Args:
         request: The HTTP request object
-        orgid: The organization ID
+        airbyte_service: The Airbyte service of the organization
         source_definition_id: The source definition ID
         
     Returns:
         JsonResponse containing source definition specifications
     """
     try:
-        org: Org = Org.objects.get(id=orgid)
-        airbyte_service: AirbyteService = AirbyteService(org)
         specs: Dict[str, Any] = airbyte_service.get_source_definition_specifications(source_definition_id)
         return JsonResponse({"specifications": specs})
     except Exception as e:
         logger.error(f"get_source_definition_specifications: {str(e)}")
         return JsonResponse({"error": str(e)}, status=500)
 
-def create_source(request: Request, orgid: str) -> JsonResponse:
+@require_airbyte_service
+def create_source(request: Request, airbyte_service: AirbyteService) -> JsonResponse:
     """
     Create a new source in Airbyte.
     
     Args:
         request: The HTTP request object containing source details
-        orgid: The organization ID
+        airbyte_service: The Airbyte service of the organization
         
     Returns:
         JsonResponse containing the created source information
     """
     try:
         source_create_request: SourceCreateRequest = SourceCreateRequest(**request.data)
-        org: Org = Org.objects.get(id=orgid)
-        airbyte_service: AirbyteService = AirbyteService(org)
         source: Dict[str, Any] = airbyte_service.create_source(
             source_definition_id=source_create_request.sourceDefId,
             source_name=source_create_request.name,
@@ -170,84 +217,79 @@ def create_source(request: Request, orgid: str) -> JsonResponse:
         logger.error(f"create_source: {str(e)}")
         return JsonResponse({"error": str(e)}, status=500)
 
-def get_sources(request: Request, orgid: str) -> JsonResponse:
+@require_airbyte_service
+def get_sources(request: Request, airbyte_service: AirbyteService) -> JsonResponse:
     """
     Get all sources for an organization.
     
     Args:
         request: The HTTP request object
-        orgid: The organization ID
+        airbyte_service: The Airbyte service of the organization
         
     Returns:
         JsonResponse containing list of sources
     """
     try:
-        org: Org = Org.objects.get(id=orgid)
-        airbyte_service: AirbyteService = AirbyteService(org)
         sources: List[Dict[str, Any]] = airbyte_service.list_sources()
         return JsonResponse({"sources": sources})
     except Exception as e:
         logger.error(f"get_sources: {str(e)}")
         return JsonResponse({"error": str(e)}, status=500)
 
-def get_source_schema(request: Request, orgid: str, source_id: str) -> JsonResponse:
+@require_airbyte_service
+def get_source_schema(request: Request, airbyte_service: AirbyteService, source_id: str) -> JsonResponse:
     """
     Get schema for a specific source.
     
     Args:
         request: The HTTP request object
-        orgid: The organization ID
+        airbyte_service: The Airbyte service of the organization
         source_id: The source ID
         
     Returns:
         JsonResponse containing source schema
     """
     try:
-        org: Org = Org.objects.get(id=orgid)
-        airbyte_service: AirbyteService = AirbyteService(org)
         schema: Dict[str, Any] = airbyte_service.discover_source_schema(source_id)
         return JsonResponse({"schema": schema})
     except Exception as e:
         logger.error(f"get_source_schema: {str(e)}")
         return JsonResponse({"error": str(e)}, status=500)
 
-def get_destination_definition_specifications(request: Request, orgid: str, destination_definition_id: str) -> JsonResponse:
+@require_airbyte_service
+def get_destination_definition_specifications(request: Request, airbyte_service: AirbyteService, destination_definition_id: str) -> JsonResponse:
     """
     Get specifications for a specific destination definition.
     
     Args:
         request: The HTTP request object
-        orgid: The organization ID
+        airbyte_service: The Airbyte service of the organization
         destination_definition_id: The destination definition ID
         
     Returns:
         JsonResponse containing destination definition specifications
     """
     try:
-        org: Org = Org.objects.get(id=orgid)
-        airbyte_service: AirbyteService = AirbyteService(org)
         specs: Dict[str, Any] = airbyte_service.get_destination_definition_specifications(destination_definition_id)
         return JsonResponse({"specifications": specs})
     except Exception as e:
         logger.error(f"get_destination_definition_specifications: {str(e)}")
         return JsonResponse({"error": str(e)}, status=500)
 
-def create_connection(request: Request, orgid: str) -> JsonResponse:
+@require_airbyte_service
+def create_connection(request: Request, airbyte_service: AirbyteService) -> JsonResponse:
     """
     Create a new connection between source and destination.
     
     Args:
         request: The HTTP request object containing connection details
-        orgid: The organization ID
+        airbyte_service: The Airbyte service of the organization
         
     Returns:
         JsonResponse containing the created connection information
     """
     try:
         connection_request: ConnectionCreateRequest = ConnectionCreateRequest(**request.data)
-        org: Org = Org.objects.get(id=orgid)
-        airbyte_service: AirbyteService = AirbyteService(org)
-        
         connection: Dict[str, Any] = airbyte_service.create_connection(
             source_id=connection_request.sourceId,
             destination_id=connection_request.destinationId,
@@ -260,22 +302,20 @@ def create_connection(request: Request, orgid: str) -> JsonResponse:
         logger.error(f"create_connection: {str(e)}")
         return JsonResponse({"error": str(e)}, status=500)
 
-def update_connection(request: Request, orgid: str) -> JsonResponse:
+@require_airbyte_service
+def update_connection(request: Request, airbyte_service: AirbyteService) -> JsonResponse:
     """
     Update an existing connection.
     
     Args:
         request: The HTTP request object containing updated connection details
-        orgid: The organization ID
+        airbyte_service: The Airbyte service of the organization
         
     Returns:
         JsonResponse containing the updated connection information
     """
     try:
         connection_update: ConnectionUpdateRequest = ConnectionUpdateRequest(**request.data)
-        org: Org = Org.objects.get(id=orgid)
-        airbyte_service: AirbyteService = AirbyteService(org)
-        
         result: Dict[str, Any] = airbyte_service.update_connection(
             connection_id=connection_update.connectionId,
             sync_catalog=connection_update.syncCatalog
@@ -285,43 +325,71 @@ def update_connection(request: Request, orgid: str) -> JsonResponse:
         logger.error(f"update_connection: {str(e)}")
         return JsonResponse({"error": str(e)}, status=500)
 
-def trigger_sync(request: Request, orgid: str) -> JsonResponse:
+@require_airbyte_service
+def trigger_sync(request: Request, airbyte_service: AirbyteService) -> JsonResponse:
     """
-    Trigger a sync for a specific connection.
+    Trigger a sync for a specific connection. The sync is triggered from a celery task
+    so that the request doesn't wait on Airbyte. The Airbyte job, whose id get_job_status
+    takes, is returned by get_sync_task_result once the task has run.
     
     Args:
         request: The HTTP request object containing connection ID
-        orgid: The organization ID
+        airbyte_service: The Airbyte service of the organization
         
     Returns:
-        JsonResponse containing the sync job information
+        JsonResponse {"task_id": ...} with the id of the celery task triggering the sync,
+        in place of the {"job": ...} this used to return
     """
     try:
         sync_request: ConnectionSyncRequest = ConnectionSyncRequest(**request.data)
-        org: Org = Org.objects.get(id=orgid)
-        airbyte_service: AirbyteService = AirbyteService(org)
-        
-        job: Dict[str, Any] = airbyte_service.trigger_sync(sync_request.connectionId)
-        return JsonResponse({"job": job})
+        task = trigger_airbyte_sync.delay(airbyte_service.org.id, sync_request.connectionId)
+        return JsonResponse({"task_id": task.id})
     except Exception as e:
         logger.error(f"trigger_sync: {str(e)}")
         return JsonResponse({"error": str(e)}, status=500)
 
-def get_job_status(request: Request, orgid: str, job_id: str) -> JsonResponse:
+@require_airbyte_service
+def get_sync_task_result(request: Request, airbyte_service: AirbyteService, task_id: str) -> JsonResponse:
+    """
+    Get the Airbyte job started by a trigger_sync task. Like the rest of this module it is
+    not on a router yet, see the airbyte_router routes.py expects.
+    
+    Args:
+        request: The HTTP request object
+        airbyte_service: The Airbyte service of the organization
+        task_id: The task ID returned by trigger_sync
+        
+    Returns:
+        JsonResponse containing the task status, and the sync job information once it has run
+    """
+    try:
+        result: AsyncResult = AsyncResult(task_id)
+        if not result.ready():
+            return JsonResponse({"status": result.status})
+        if result.failed():
+            return JsonResponse({"status": result.status, "error": str(result.result)}, status=500)
+        value: Optional[Dict[str, Any]] = result.result
+        if not value or str(value["org_id"]) != str(airbyte_service.org.id):
+            return JsonResponse({"error": "sync task not found"}, status=404)
+        return JsonResponse({"status": result.status, "job": value["job"]})
+    except Exception as e:
+        logger.error(f"get_sync_task_result: {str(e)}")
+        return JsonResponse({"error": str(e)}, status=500)
+
+@require_airbyte_service
+def get_job_status(request: Request, airbyte_service: AirbyteService, job_id: str) -> JsonResponse:
     """
     Get status of a specific job.
     
     Args:
         request: The HTTP request object
-        orgid: The organization ID
+        airbyte_service: The Airbyte service of the organization
         job_id: The job ID
         
     Returns:
         JsonResponse containing the job status information
     """
     try:
-        org: Org = Org.objects.get(id=orgid)
-        airbyte_service: AirbyteService = AirbyteService(org)
         status: Dict[str, Any] = airbyte_service.get_job_status(job_id)
         return JsonResponse({"status": status})
     except Exception as e:
@@ -76,6 +76,12 @@ def put_dbt_github(request, payload: OrgDbtGitHub):
     if not repo_exists:
         raise HttpError(400, "Github repository does not exist")
 
+    # a gitrepoBranch of "" or null goes back to the repo's default branch. if none is sent
+    # the stored branch is kept, unless the repo changes since the new one may not have it
+    if "gitrepoBranch" in payload.__fields_set__:
+        org.dbt.gitrepo_branch = payload.gitrepoBranch or None
+    elif org.dbt.gitrepo_url != payload.gitrepoUrl:
+        org.dbt.gitrepo_branch = None
     org.dbt.gitrepo_url = payload.gitrepoUrl
     org.dbt.gitrepo_access_token_secret = payload.gitrepoAccessToken
     org.dbt.save()
@@ -125,6 +131,7 @@ def put_dbt_github(request, payload: OrgDbtGitHub):
         org.dbt.gitrepo_access_token_secret,
         org_dir,
         None,
+        org.dbt.gitrepo_branch,
     )
 
     return {"task_id": task.id}
@@ -157,6 +164,7 @@ def get_dbt_workspace(request):
 
     return {
         "gitrepo_url": orguser.org.dbt.gitrepo_url,
+        "gitrepo_branch": orguser.org.dbt.gitrepo_branch,
         "gitrepo_access_token": "*********" if secret_block_exists else None,
         "target_type": orguser.org.dbt.target_type,
         "default_schema": orguser.org.dbt.default_schema,
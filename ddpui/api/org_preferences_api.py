@@ -155,13 +155,10 @@ def get_tools_versions(request):
     ver = prefect_service.get_prefect_version()
     versions.append({"Prefect": {"version": ver if ver else "Not available"}})
 
-    # dbt Version
-    ver = elementary_service.get_dbt_version(org)
-    versions.append({"DBT": {"version": ver if ver else "Not available"}})
-
-    # elementary Version
-    ver = elementary_service.get_edr_version(org)
-    versions.append({"Elementary": {"version": ver if ver else "Not available"}})
+    # dbt & elementary Versions
+    dbt_ver, edr_ver = elementary_service.get_dbt_and_edr_versions(org)
+    versions.append({"DBT": {"version": dbt_ver if dbt_ver else "Not available"}})
+    versions.append({"Elementary": {"version": edr_ver if edr_ver else "Not available"}})
 
     # Superset Version
     versions.append(
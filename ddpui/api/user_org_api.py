@@ -133,6 +133,8 @@ def post_organization_user(request, payload: OrgUserCreate):  # pylint: disable=
 def post_login(request):
     """Uses the username and password in the request to return an auth token"""
     request_obj = json.loads(request.body)
+    if not request_obj.get("username") or not request_obj.get("password"):
+        raise HttpError(400, "username and password are required")
     token = views.obtain_auth_token(request)
     if "token" in token.data:
         retval = orguserfunctions.lookup_user(request_obj["username"])
@@ -364,7 +366,7 @@ def post_modify_orguser_role(request, payload: OrgUserUpdateNewRole):
         raise HttpError(400, "User does not exist")
 
     orguser_to_be_assigned.new_role = role_to_be_assgined
-    orguser_to_be_assigned.save()
+    orguser_to_be_assigned.save(update_fields=["new_role", "updated_at"])
 
     return {"success": 1}
 
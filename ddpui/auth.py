@@ -38,7 +38,7 @@ class PlatformAdmin(HttpBearer):
     """
 
     def authenticate(self, request, token):
-        tokenrecord = Token.objects.filter(key=token).first()
+        tokenrecord = Token.objects.select_related("user").filter(key=token).first()
         if tokenrecord and tokenrecord.user:
             request.user = tokenrecord.user
             adminuser = AdminUser.objects.filter(user=request.user).first()
@@ -74,14 +74,14 @@ def has_permission(permission_slugs: list):
 
 def authenticate_org_user(request, token, allowed_roles, require_org):
     """docstring"""
-    tokenrecord = Token.objects.filter(key=token).first()
+    tokenrecord = Token.objects.select_related("user").filter(key=token).first()
     if tokenrecord and tokenrecord.user:
         request.user = tokenrecord.user
         q_orguser = OrgUser.objects.filter(user=request.user)
         if request.headers.get("x-dalgo-org"):
             orgslug = request.headers["x-dalgo-org"]
             q_orguser = q_orguser.filter(org__slug=orgslug)
-        orguser = q_orguser.first()
+        orguser = q_orguser.select_related("org", "user").first()
         if orguser is not None:
             if require_org and orguser.org is None:
                 raise HttpError(400, "register an organization first")
@@ -95,7 +95,7 @@ class CustomAuthMiddleware(HttpBearer):
     """new middleware that works based on permissions from db"""
 
     def authenticate(self, request, token):
-        tokenrecord = Token.objects.filter(key=token).first()
+        tokenrecord = Token.objects.select_related("user").filter(key=token).first()
         if tokenrecord and tokenrecord.user:
             request.user = tokenrecord.user
             q_orguser = OrgUser.objects.filter(user=request.user)
@@ -107,9 +107,9 @@ class CustomAuthMiddleware(HttpBearer):
                 if orguser.org is None:
                     raise HttpError(400, "register an organization first")
 
-                permission_slugs = RolePermission.objects.filter(role=orguser.new_role).values_list(
-                    "permission__slug", flat=True
-                )
+                permission_slugs = RolePermission.objects.filter(
+                    role_id=orguser.new_role_id
+                ).values_list("permission__slug", flat=True)
 
                 request.permissions = list(permission_slugs) or []
                 request.orguser = orguser
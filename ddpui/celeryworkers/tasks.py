@@ -1,8 +1,10 @@
 """these are tasks which we run through celery"""
 
 import os
+import shlex
 import shutil
 from pathlib import Path
+from uuid import uuid4
 from datetime import datetime, timedelta
 from subprocess import CompletedProcess
 import pytz
@@ -77,6 +79,13 @@ logger = CustomLogger("ddpui")
 UTC = timezone.UTC
 
 
+@app.task(bind=False)
+def delete_tree(path: str):
+    """deletes a directory tree which is no longer needed e.g. a replaced clone"""
+    shutil.rmtree(path, ignore_errors=True)
+    logger.info("deleted %s", path)
+
+
 @app.task(bind=True)
 def clone_github_repo(
     self,
@@ -85,8 +94,20 @@ def clone_github_repo(
     gitrepo_access_token: str | None,
     org_dir: str,
     taskprogress: TaskProgress | None,
+    branch: str | None = None,
+    sparse_paths: list[str] | None = None,
 ) -> bool:
-    """clones an org's github repo"""
+    """
+    clones an org's github repo
+    only the tip of a single branch is fetched since dbt doesn't need the history;
+    run `git fetch --unshallow` inside the repo if the full history is ever required
+    the working tree is restricted to `sparse_paths` (plus the files at the repo root) if
+    they are given, else the full tree is checked out. they are not inferred from the dbt
+    project since the sparse checkout outlives the clone: later `git pull`s keep it, and
+    would not check out paths added to dbt_project.yml or packages.yml after the clone
+    submodules are cloned shallow and in parallel, if there are any; failing to fetch them
+    doesn't fail the clone
+    """
     if taskprogress is None:
         child = False
         taskprogress = TaskProgress(
@@ -122,14 +143,27 @@ def clone_github_repo(
         )
         logger.info("created project_dir %s", org_dir)
 
-    elif dbtrepo_dir.exists():
-        shutil.rmtree(str(dbtrepo_dir))
+    # clone into a staging dir and swap it in only once it is complete, so that a failed
+    # clone leaves the previous one untouched and a retry has nothing to clean up
+    staging_dir = org_dir / f"dbtrepo.staging-{uuid4().hex}"
 
-    cmd = f"git clone {gitrepo_url} dbtrepo"
+    cmd = "git clone --depth 1 --single-branch --filter=blob:none --sparse"
+    if branch:
+        cmd += f" --branch {shlex.quote(branch)}"
+    cmd += f" {gitrepo_url} {staging_dir.name}"
 
     try:
         runcmd(cmd, org_dir)
+        if sparse_paths is None:
+            runcmd("git sparse-checkout disable", staging_dir)
+        else:
+            runcmd(
+                f"git sparse-checkout set {' '.join(shlex.quote(path) for path in sparse_paths)}",
+                staging_dir,
+            )
     except Exception as error:
+        if staging_dir.exists():
+            delete_tree.apply_async(args=[str(staging_dir)], priority=9)
         taskprogress.add(
             {
                 "message": "git clone failed",
@@ -140,6 +174,30 @@ def clone_github_repo(
         logger.exception(error)
         return None
 
+    # fetch submodules (e.g. shared macro packages) in parallel, also without history
+    # a submodule we can't reach, e.g. over ssh, is skipped rather than failing the clone
+    if (staging_dir / ".gitmodules").exists():
+        try:
+            runcmd(
+                f"git submodule update --init --recursive --depth 1 --jobs {os.cpu_count() or 4}",
+                staging_dir,
+            )
+        except Exception as error:
+            logger.warning("failed to fetch the git submodules for %s: %s", org_slug, error)
+            taskprogress.add(
+                {
+                    "message": "could not fetch the git submodules",
+                    "status": "running",
+                }
+            )
+
+    if dbtrepo_dir.exists():
+        # move the old clone out of the way (a rename is instant) and delete it in the background
+        trash_dir = org_dir / f".trash-{uuid4().hex}"
+        os.rename(dbtrepo_dir, trash_dir)
+        delete_tree.apply_async(args=[str(trash_dir)], priority=9)
+    os.replace(staging_dir, dbtrepo_dir)
+
     taskprogress.add(
         {
             "message": "cloned git repo",
@@ -183,13 +241,14 @@ def setup_dbtworkspace(self, org_id: int, payload: dict) -> str:
     # this client'a dbt setup happens here
     org_dir = DbtProjectManager.get_org_dir(org)
 
-    # five parameters here is correct despite vscode thinking otherwise
+    # six parameters here is correct despite vscode thinking otherwise
     dbtcloned_repo_path = clone_github_repo(
         org.slug,
         payload["gitrepoUrl"],
         payload["gitrepoAccessToken"],
         org_dir,
         taskprogress,
+        payload.get("gitrepoBranch"),
     )
     if not dbtcloned_repo_path:
         raise Exception("Failed to clone git repo")
@@ -198,6 +257,7 @@ def setup_dbtworkspace(self, org_id: int, payload: dict) -> str:
 
     dbt = OrgDbt(
         gitrepo_url=payload["gitrepoUrl"],
+        gitrepo_branch=payload.get("gitrepoBranch"),
         project_dir=DbtProjectManager.get_dbt_repo_relative_path(dbtcloned_repo_path),
         dbt_venv=DbtProjectManager.DEFAULT_DBT_VENV_REL_PATH,
         target_type=warehouse.wtype,
@@ -297,19 +357,21 @@ def run_dbt_commands(self, org_id: int, task_id: str, dbt_run_params: dict = Non
                 f"{dbt_binary} clean --profiles-dir=profiles", project_dir
             )
             command_output = process.stdout.decode("utf-8").split("\n")
-            taskprogress.add(
-                {
-                    "message": "dbt clean output",
-                    "status": "running",
-                }
-            )
-            for cmd_out in command_output:
-                taskprogress.add(
+            taskprogress.add_many(
+                [
+                    {
+                        "message": "dbt clean output",
+                        "status": "running",
+                    }
+                ]
+                + [
                     {
                         "message": cmd_out,
                         "status": "running",
                     }
-                )
+                    for cmd_out in command_output
+                ]
+            )
         except subprocess.CalledProcessError as error:
             taskprogress.add(
                 {
@@ -333,19 +395,21 @@ def run_dbt_commands(self, org_id: int, task_id: str, dbt_run_params: dict = Non
                 f"{dbt_binary} deps --profiles-dir=profiles", project_dir
             )
             command_output = process.stdout.decode("utf-8").split("\n")
-            taskprogress.add(
-                {
-                    "message": "dbt deps output",
-                    "status": "running",
-                }
-            )
-            for cmd_out in command_output:
-                taskprogress.add(
+            taskprogress.add_many(
+                [
+                    {
+                        "message": "dbt deps output",
+                        "status": "running",
+                    }
+                ]
+                + [
                     {
                         "message": cmd_out,
                         "status": "running",
                     }
-                )
+                    for cmd_out in command_output
+                ]
+            )
         except subprocess.CalledProcessError as error:
             taskprogress.add(
                 {
@@ -376,19 +440,21 @@ def run_dbt_commands(self, org_id: int, task_id: str, dbt_run_params: dict = Non
                 f"{cmd} --profiles-dir=profiles", project_dir
             )
             command_output = process.stdout.decode("utf-8").split("\n")
-            taskprogress.add(
-                {
-                    "message": "dbt run output",
-                    "status": "running",
-                }
-            )
-            for cmd_out in command_output:
-                taskprogress.add(
+            taskprogress.add_many(
+                [
+                    {
+                        "message": "dbt run output",
+                        "status": "running",
+                    }
+                ]
+                + [
                     {
                         "message": cmd_out,
                         "status": "running",
                     }
-                )
+                    for cmd_out in command_output
+                ]
+            )
         except subprocess.CalledProcessError as error:
             taskprogress.add(
                 {
@@ -607,6 +673,22 @@ def sync_flow_runs_of_deployments(deployment_ids: list[str] = None, look_back_ho
             continue
 
 
+@app.task(bind=False)
+def trigger_airbyte_sync(org_id: int, connection_id: str):
+    """
+    triggers an airbyte sync for a connection, so that api callers don't wait on airbyte
+    returns the org's id along with the airbyte job so that its result can be checked
+    against the org asking for it
+    """
+    org = Org.objects.filter(id=org_id).first()
+    if org is None:
+        logger.error("org %s not found, not syncing connection %s", org_id, connection_id)
+        return None
+    job = airbyte_service.AirbyteService(org).trigger_sync(connection_id)
+    logger.info("triggered sync for connection %s | org %s", connection_id, org.slug)
+    return {"org_id": org.id, "job": job}
+
+
 @app.task(bind=True)
 def add_custom_connectors_to_workspace(self, workspace_id, custom_sources: list[dict]):
     """
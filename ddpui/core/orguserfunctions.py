@@ -9,6 +9,7 @@ from uuid import uuid4
 
 from django.contrib.auth.models import User
 from django.db import transaction
+from django.db.models import Q
 from django.utils.text import slugify
 from django.utils import timezone as django_timezone
 
@@ -44,11 +45,12 @@ logger = CustomLogger("ddpui")
 
 def lookup_user(email: str):
     """look up user by username"""
-    user = User.objects.filter(email=email).first()
-
-    userattributes = UserAttributes.objects.filter(user=user).first()
+    # the user comes back with its attributes, in the same query
+    userattributes = UserAttributes.objects.select_related("user").filter(user__email=email).first()
     if userattributes is None:
+        user = User.objects.filter(email=email).first()
         userattributes = UserAttributes.objects.create(user=user)
+    user = userattributes.user
 
     email_verified = userattributes.email_verified
     if email_verified is False:
@@ -56,7 +58,7 @@ def lookup_user(email: str):
         email_verified = OrgUser.objects.filter(user=user, email_verified=True).exists()
         if email_verified:
             userattributes.email_verified = True
-            userattributes.save()
+            userattributes.save(update_fields=["email_verified", "updated_at"])
             # to be removed soon
             OrgUser.objects.filter(user=user, email_verified=False).update(
                 email_verified=True, updated_at=django_timezone.now()
@@ -79,10 +81,7 @@ def signup_orguser(payload: OrgUserCreate):
     if signupcode not in [os.getenv("SIGNUPCODE"), os.getenv("DEMO_SIGNUPCODE")]:
         return None, "That is not the right signup code"
 
-    if User.objects.filter(email=payload.email).exists():
-        return None, f"user having email {payload.email} exists"
-
-    if User.objects.filter(username=payload.email).exists():
+    if User.objects.filter(Q(email=payload.email) | Q(username=payload.email)).exists():
         return None, f"user having email {payload.email} exists"
 
     if not helpers.isvalid_email(payload.email):
@@ -109,7 +108,6 @@ def signup_orguser(payload: OrgUserCreate):
             else Role.objects.filter(slug=GUEST_ROLE).first()
         ),
     )
-    orguser.save()
     UserPreferences.objects.create(orguser=orguser, enable_email_notifications=True)
     logger.info(
         f"created user [account-manager] " f"{orguser.user.email} having userid {orguser.user.id}"
@@ -134,13 +132,17 @@ def signup_orguser(payload: OrgUserCreate):
 
 def update_orguser(orguser: OrgUser, payload: OrgUserUpdate):
     """updates attributes of an OrgUser"""
+    user_fields = []
     if payload.email:
         orguser.user.email = payload.email.lower().strip()
+        user_fields.append("email")
     if payload.active is not None:
         orguser.user.is_active = payload.active
+        user_fields.append("is_active")
     if payload.role:
         orguser.role = payload.role
-    orguser.user.save()
+    if user_fields:
+        orguser.user.save(update_fields=user_fields)
 
     logger.info(f"updated orguser {orguser.user.email}")
     return from_orguser(orguser)
@@ -148,14 +150,18 @@ def update_orguser(orguser: OrgUser, payload: OrgUserUpdate):
 
 def update_orguser_v1(orguser: OrgUser, payload: OrgUserUpdatev1):
     """updates attributes of an OrgUser"""
+    user_fields = []
     if payload.email:
         orguser.user.email = payload.email.lower().strip()
+        user_fields.append("email")
     if payload.active is not None:
         orguser.user.is_active = payload.active
+        user_fields.append("is_active")
+    if user_fields:
+        orguser.user.save(update_fields=user_fields)
     if payload.role_uuid:
         orguser.new_role = Role.objects.filter(uuid=payload.role_uuid).first()
-    orguser.user.save()
-    orguser.save()
+        orguser.save(update_fields=["new_role", "updated_at"])
 
     logger.info(f"updated orguser {orguser.user.email}")
     return from_orguser(orguser)
@@ -184,8 +190,8 @@ def transfer_ownership(requestor_orguser: OrgUser, payload: OrgUserNewOwner):
     requestor_orguser.role = OrgUserRole.PIPELINE_MANAGER
     try:
         with transaction.atomic():
-            new_owner.save()
-            requestor_orguser.save()
+            new_owner.save(update_fields=["role", "updated_at"])
+            requestor_orguser.save(update_fields=["role", "updated_at"])
     except Exception as error:
         logger.exception(error)
         return None, "failed to transfer ownership"
@@ -405,8 +411,11 @@ def invite_user_v1(orguser: OrgUser, payload: NewInvitationSchema):
 
 def accept_invitation(payload: AcceptInvitationSchema):
     """accept an invitation"""
-    invitation = Invitation.objects.filter(invite_code=payload.invite_code).first()
-    if invitation is None:
+    try:
+        invitation = Invitation.objects.select_related("invited_by__org").get(
+            invite_code=payload.invite_code
+        )
+    except Invitation.DoesNotExist:
         return None, "invalid invite code"
 
     # we can have one auth user mapped to multiple orguser and hence multiple orgs
@@ -445,8 +454,11 @@ def accept_invitation(payload: AcceptInvitationSchema):
 
 def accept_invitation_v1(payload: AcceptInvitationSchema):
     """accept an invitation"""
-    invitation = Invitation.objects.filter(invite_code=payload.invite_code).first()
-    if invitation is None:
+    try:
+        invitation = Invitation.objects.select_related("invited_by__org").get(
+            invite_code=payload.invite_code
+        )
+    except Invitation.DoesNotExist:
         return None, "invalid invite code"
 
     # we can have one auth user mapped to multiple orguser and hence multiple orgs
@@ -532,7 +544,7 @@ def resend_invitation(invitation_id: str):
 
     if invitation:
         invitation.invited_on = timezone.as_utc(datetime.utcnow())
-        invitation.save()
+        invitation.save(update_fields=["invited_on", "updated_at"])
         # trigger an email to the user
         frontend_url = os.getenv("FRONTEND_URL")
         invite_url = f"{frontend_url}/invitations/?invite_code={invitation.invite_code}"
@@ -587,7 +599,7 @@ def confirm_reset_password(payload: ResetPasswordSchema):
         return None, "could not look up request from this token"
 
     orguser.user.set_password(payload.password.get_secret_value())
-    orguser.user.save()
+    orguser.user.save(update_fields=["password"])
 
     return None, None
 
@@ -599,7 +611,7 @@ def change_password(payload: ChangePasswordSchema, orguser: OrgUser):
         return None, "Password and confirm password must be same"
 
     orguser.user.set_password(payload.password.get_secret_value())
-    orguser.user.save()
+    orguser.user.save(update_fields=["password"])
 
     return None, None
 
@@ -663,7 +675,7 @@ def ensure_orguser_for_org(orguser: OrgUser, org):
     """
     if orguser.org is None:
         orguser.org = org
-        orguser.save()
+        orguser.save(update_fields=["org", "updated_at"])
     else:
         OrgUser.objects.create(
             user=orguser.user,
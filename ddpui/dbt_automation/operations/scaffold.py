@@ -1,11 +1,13 @@
 """setup the dbt project"""
 
 import glob
+import importlib.metadata
 import os, shutil, yaml
 from pathlib import Path
 from string import Template
 from logging import basicConfig, getLogger, INFO
 import subprocess, sys
+from uuid import uuid4
 
 from ddpui.dbt_automation.utils.warehouseclient import get_client
 from ddpui.dbt_automation.utils.interfaces.warehouse_interface import WarehouseInterface
@@ -16,6 +18,121 @@ basicConfig(level=INFO)
 logger = getLogger()
 
 
+def create_dbt_venv(venv_dir: Path, warehouse_name: str, requirements: list[str] = None):
+    """
+    creates a python virtual environment with dbt and the warehouse's adapter installed
+    from the pinned `requirements` if they are given, else the latest adapter
+    if DBT_WHEELHOUSE is set, packages are installed from the wheels in that directory
+    without going to the package index. populate it once with the versions installed
+    alongside this code (see get_dbt_requirements), e.g.
+        pip download dbt-core==1.8.7 dbt-postgres==1.8.2 dbt-bigquery==1.8.2 -d $DBT_WHEELHOUSE
+    the pip bundled with python (via ensurepip) is used as is; it is recent enough to
+    install dbt and upgrading it would cost another download and install per venv
+    raises subprocess.CalledProcessError if the venv could not be created or installed into
+    """
+    subprocess.check_call([sys.executable, "-m", "venv", venv_dir])
+
+    # install dbt and dbt-bigquery or dbt-postgres based on the warehouse in the virtual environment
+    logger.info("installing package to setup & run for a %s warehouse", warehouse_name)
+    # a single pip invocation so that the resolver runs once for all packages
+    logger.info("using pip from %s", venv_dir / "bin" / "pip")
+    pip_install = [venv_dir / "bin" / "pip", "install"]
+    if os.getenv("DBT_WHEELHOUSE"):
+        logger.info("installing from the wheelhouse at %s", os.getenv("DBT_WHEELHOUSE"))
+        pip_install += ["--no-index", f"--find-links={os.getenv('DBT_WHEELHOUSE')}"]
+    subprocess.check_call(pip_install + (requirements or [f"dbt-{warehouse_name}"]))
+
+
+def relocate_venv(venv_dir: Path, old_prefix: Path, new_prefix: Path):
+    """rewrites the absolute paths under `old_prefix` baked into the scripts of a venv"""
+    for script in (venv_dir / "bin").iterdir():
+        if script.is_symlink() or not script.is_file():
+            continue
+        try:
+            content = script.read_text(encoding="utf-8")
+        except UnicodeDecodeError:
+            continue
+        if str(old_prefix) in content:
+            script.write_text(content.replace(str(old_prefix), str(new_prefix)), encoding="utf-8")
+
+
+def layer_venv(venv_dir: Path, base_venv_dir: Path):
+    """
+    creates a lightweight virtual environment which sees the packages of `base_venv_dir`
+    via a .pth file. packages installed into it take precedence over the base venv's
+    """
+    subprocess.check_call([sys.executable, "-m", "venv", "--without-pip", venv_dir])
+
+    site_packages = Path("lib") / f"python{sys.version_info.major}.{sys.version_info.minor}"
+    site_packages = site_packages / "site-packages"
+    with open(venv_dir / site_packages / "dbt_base_venv.pth", "w", encoding="utf-8") as pthfile:
+        pthfile.write(str(base_venv_dir / site_packages) + "\n")
+
+    # the base venv's console scripts (dbt, pip, ...) are run with this venv's python
+    # bin/ may also hold directories, e.g. the __pycache__ of a script installed as a module
+    for script in (base_venv_dir / "bin").iterdir():
+        if os.path.isfile(script) and not (venv_dir / "bin" / script.name).exists():
+            shutil.copy2(script, venv_dir / "bin" / script.name)
+    relocate_venv(venv_dir, base_venv_dir, venv_dir)
+
+
+def get_dbt_requirements(warehouse_name: str):
+    """
+    dbt-core and the warehouse's dbt adapter pinned to the versions installed alongside this
+    code, which are the ones we build venvs with. None if either isn't installed here
+    """
+    try:
+        return [
+            f"{package}=={importlib.metadata.version(package)}"
+            for package in ["dbt-core", f"dbt-{warehouse_name}"]
+        ]
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def setup_dbt_venv(venv_dir: Path, warehouse_name: str):
+    """
+    sets up the dbt virtual environment for a project
+    if DBT_VENV_CACHE is set, a base venv is built once per (python version, dbt-core
+    version, adapter version) under that directory and the project gets a lightweight venv
+    layered on top of it instead of pip-installing everything every time
+    """
+    requirements = get_dbt_requirements(warehouse_name)
+    if not os.getenv("DBT_VENV_CACHE") or requirements is None:
+        # without pinned versions a cached venv would keep whichever dbt was current when built
+        create_dbt_venv(venv_dir, warehouse_name, requirements)
+        return
+
+    cache_dir = Path(os.getenv("DBT_VENV_CACHE")).resolve()
+    # e.g. py310-dbt-core-1.8.7-dbt-postgres-1.8.2
+    key = f"py{sys.version_info.major}{sys.version_info.minor}-" + "-".join(
+        requirement.replace("==", "-") for requirement in requirements
+    )
+    cached_venv_dir = cache_dir / key
+
+    if not cached_venv_dir.exists():
+        logger.info("dbt venv cache miss for %s, building it", key)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        building_venv_dir = cache_dir / f"{key}.tmp-{uuid4().hex}"
+        try:
+            create_dbt_venv(building_venv_dir, warehouse_name, requirements)
+            # point its scripts at the cache path before the venv appears there
+            relocate_venv(building_venv_dir, building_venv_dir, cached_venv_dir)
+        except Exception:
+            # never let a partly built venv into the cache
+            shutil.rmtree(building_venv_dir, ignore_errors=True)
+            raise
+        try:
+            # atomic; if another process got there first we use its venv
+            os.rename(building_venv_dir, cached_venv_dir)
+        except OSError:
+            shutil.rmtree(building_venv_dir)
+
+    venv_dir = Path(venv_dir).resolve()
+    logger.info("layering dbt venv %s on top of %s", venv_dir, cached_venv_dir)
+    layer_venv(venv_dir, cached_venv_dir)
+
+
 def scaffold(config: dict, warehouse: WarehouseInterface, project_dir: str):
     """scaffolds a dbt project"""
     project_name = config["project_name"]
@@ -89,23 +206,8 @@ clean-targets:
             dbtpackgesfile,
         )
 
-    # create a python virtual environment in project directory
-    subprocess.call([sys.executable, "-m", "venv", Path(project_dir) / "venv"])
-
-    # install dbt and dbt-bigquery or dbt-postgres based on the warehouse in the virtual environment
-    logger.info("installing package to setup & run for a %s warehouse", warehouse.name)
-    logger.info("using pip from %s", Path(project_dir) / "venv" / "bin" / "pip")
-    subprocess.call(
-        [
-            Path(project_dir) / "venv" / "bin" / "pip",
-            "install",
-            "--upgrade",
-            "pip",
-        ]
-    )
-    subprocess.call(
-        [Path(project_dir) / "venv" / "bin" / "pip", "install", f"dbt-{warehouse.name}"]
-    )
+    # create a python virtual environment with dbt in the project directory
+    setup_dbt_venv(Path(project_dir) / "venv", warehouse.name)
 
     # create profiles.yaml that will be used to connect to the warehouse
     profiles_filename = Path(project_dir) / "profiles.yml"
@@ -13,6 +13,7 @@ from ddpui.models.warehouse import WarehouseCredential
 from ddpui.models.credentials import DataSourceCredential
 from ddpui.models.airbyte_sync import AirbyteSync
 from ddpui.ddpairbyte.airbyte_helpers import (
+    airbyte_session,
     get_user_workspace,
     create_customer_destination,
     normalize_simple_configs,
@@ -20,9 +21,17 @@ from ddpui.ddpairbyte.airbyte_helpers import (
     find_destination_definition_id_by_name,
 )
 from ddpui.utils.custom_logger import CustomLogger
+from ddpui.utils.ttlcache import ttl_cache
 
 logger = CustomLogger("airbyte_service")
 
+# source and destination definitions rarely change, so they are cached per workspace
+AIRBYTE_DEFINITIONS_CACHE_TTL: int = int(os.getenv("AIRBYTE_DEFINITIONS_CACHE_TTL", "300"))
+
+def _workspace_cache_key(service: "AirbyteService", *args: Any) -> Tuple[Any, ...]:
+    """Cache key for AirbyteService methods whose results depend only on the workspace and args."""
+    return (service.airbyte_url, service.workspaceId) + args
+
 # Pydantic models for API payloads and responses
 class StreamConfig(BaseModel):
     aliasName: str
@@ -105,7 +114,6 @@ class AirbyteService:
         self.org: Org = org
         self.airbyte_url: str = os.getenv("AIRBYTE_URL", "http://localhost:8006")
         self.workspaceId: str = get_user_workspace(self.org)
-        self.headers: Dict[str, str] = {"Content-Type": "application/json", "Accept": "application/json"}
         
     def _post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -122,13 +130,14 @@ class AirbyteService:
             Exception: If the request fails
         """
         url: str = f"{self.airbyte_url}/api/v1/{endpoint}"
-        response: requests.Response = requests.post(url, json=data, headers=self.headers)
+        response: requests.Response = airbyte_session.post(url, json=data)
         
         if response.status_code != 200:
             raise Exception(f"Error in Airbyte API call: {response.text}")
             
         return response.json()
         
+    @ttl_cache(AIRBYTE_DEFINITIONS_CACHE_TTL, key=_workspace_cache_key)
     def list_source_definitions(self) -> List[Dict[str, Any]]:
         """
         List all available source definitions.
@@ -140,6 +149,7 @@ class AirbyteService:
         response: Dict[str, Any] = self._post("source_definitions/list", data)
         return response.get("sourceDefinitions", [])
         
+    @ttl_cache(AIRBYTE_DEFINITIONS_CACHE_TTL, key=_workspace_cache_key)
     def get_source_definition_specifications(self, source_definition_id: str) -> Dict[str, Any]:
         """
         Get specifications for a source definition.
@@ -205,6 +215,7 @@ class AirbyteService:
         response: Dict[str, Any] = self._post("sources/discover_schema", data)
         return response.get("catalog", {})
         
+    @ttl_cache(AIRBYTE_DEFINITIONS_CACHE_TTL, key=_workspace_cache_key)
     def get_destination_definition_specifications(self, destination_definition_id: str) -> Dict[str, Any]:
         """
         Get specifications for a destination definition.
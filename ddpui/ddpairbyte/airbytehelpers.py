@@ -2,6 +2,7 @@ from typing import List, Dict, Any, Optional, Union, Tuple, cast, TypeVar, TYPE_
 import json
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import time
 from django.conf import settings
 from pydantic import BaseModel, Field
@@ -16,6 +17,13 @@ if TYPE_CHECKING:
 
 logger = CustomLogger("airbyte_helpers")
 
+# one connection pool for all Airbyte calls, so that consecutive calls reuse open connections
+AIRBYTE_HTTP_POOL_SIZE: int = int(os.getenv("AIRBYTE_HTTP_POOL_SIZE", "32"))
+airbyte_session: requests.Session = requests.Session()
+airbyte_session.mount("http://", HTTPAdapter(pool_maxsize=AIRBYTE_HTTP_POOL_SIZE))
+airbyte_session.mount("https://", HTTPAdapter(pool_maxsize=AIRBYTE_HTTP_POOL_SIZE))
+airbyte_session.headers.update({"Content-Type": "application/json", "Accept": "application/json"})
+
 # Define Pydantic models for API requests and responses
 class WorkspaceResponse(BaseModel):
     workspaceId: str
@@ -83,11 +91,10 @@ def get_user_workspace(org: Org) -> str:
         Exception: If unable to get or create workspace
     """
     airbyte_url: str = os.getenv("AIRBYTE_URL", "http://localhost:8006")
-    headers: Dict[str, str] = {"Content-Type": "application/json", "Accept": "application/json"}
     
     # First try to find existing workspace
     workspace_list_url: str = f"{airbyte_url}/api/v1/workspaces/list"
-    response: requests.Response = requests.post(workspace_list_url, json={}, headers=headers)
+    response: requests.Response = airbyte_session.post(workspace_list_url, json={})
     
     if response.status_code != 200:
         raise Exception(f"Failed to list workspaces: {response.text}")
@@ -113,7 +120,7 @@ def get_user_workspace(org: Org) -> str:
     create_url: str = f"{airbyte_url}/api/v1/workspaces/create"
     create_data: Dict[str, str] = {"name": workspace_name}
     
-    create_response: requests.Response = requests.post(create_url, json=create_data, headers=headers)
+    create_response: requests.Response = airbyte_session.post(create_url, json=create_data)
     
     if create_response.status_code != 200:
         raise Exception(f"Failed to create workspace: {create_response.text}")
@@ -157,12 +164,11 @@ def find_destination_definition_id_by_name(airbyte_service: 'AirbyteService', de
         Destination definition ID if found, None otherwise
     """
     airbyte_url: str = os.getenv("AIRBYTE_URL", "http://localhost:8006")
-    headers: Dict[str, str] = {"Content-Type": "application/json", "Accept": "application/json"}
     
     list_url: str = f"{airbyte_url}/api/v1/destination_definitions/list"
     data: Dict[str, str] = {"workspaceId": airbyte_service.workspaceId}
     
-    response: requests.Response = requests.post(list_url, json=data, headers=headers)
+    response: requests.Response = airbyte_session.post(list_url, json=data)
     
     if response.status_code != 200:
         raise Exception(f"Failed to list destination definitions: {response.text}")
@@ -228,7 +234,6 @@ def create_customer_destination(
     }
     
     airbyte_url: str = os.getenv("AIRBYTE_URL", "http://localhost:8006")
-    headers: Dict[str, str] = {"Content-Type": "application/json", "Accept": "application/json"}
     
     create_url: str = f"{airbyte_url}/api/v1/destinations/create"
     create_data: Dict[str, Any] = {
@@ -238,7 +243,7 @@ def create_customer_destination(
         "connectionConfiguration": config
     }
     
-    response: requests.Response = requests.post(create_url, json=create_data, headers=headers)
+    response: requests.Response = airbyte_session.post(create_url, json=create_data)
     
     if response.status_code != 200:
         raise Exception(f"Failed to create destination: {response.text}")
@@ -1,11 +1,20 @@
 """functions to set up elementary"""
 
 import os
+import asyncio
+from functools import lru_cache
 from pathlib import Path
+from typing import Sequence
 import subprocess
 from uuid import uuid4
 from datetime import datetime
 import yaml
+
+try:
+    # libyaml's loader, much faster than the pure python one
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # pyyaml built without libyaml
+    from yaml import SafeLoader as YamlSafeLoader
 import boto3
 import boto3.exceptions
 from ninja.errors import HttpError
@@ -23,7 +32,7 @@ from ddpui.core.pipelinefunctions import setup_edr_send_report_task_config
 from ddpui.ddpdbt.schema import DbtProjectParams
 from ddpui.core.orgdbt_manager import DbtProjectManager
 from ddpui.ddpprefect import prefect_service
-from ddpui.utils.helpers import generate_hash_id
+from ddpui.utils.helpers import generate_hash_id, runcmd_async
 from ddpui.ddpprefect.schema import (
     PrefectDataFlowCreateSchema3,
 )
@@ -62,31 +71,39 @@ def elementary_setup_status(org: Org) -> dict:
     return {"status": "not-set-up"}
 
 
+@lru_cache(maxsize=64)
+def _parse_yaml_cached(path: str, mtime: float):
+    """
+    parses a yaml file; the mtime is part of the cache key so that an edited file is re-read
+    callers share the returned object and must not modify it
+    """
+    with open(path, "r", encoding="utf-8") as yaml_f:  # skipcq: PTC-W6004
+        return yaml.load(yaml_f, Loader=YamlSafeLoader)
+
+
 def get_elementary_target_schema(dbt_project_yml: str):
     """{'schema': 'elementary'} or {'+schema': 'elementary'}"""
-    with open(dbt_project_yml, "r", encoding="utf-8") as dbt_project_yml_f:  # skipcq: PTC-W6004
-        dbt_project_obj = yaml.safe_load(dbt_project_yml_f)
-        if "elementary" not in dbt_project_obj["models"]:
-            return None
-        if "schema" in dbt_project_obj["models"]["elementary"]:
-            return {"schema": dbt_project_obj["models"]["elementary"]["schema"]}
-        if "+schema" in dbt_project_obj["models"]["elementary"]:
-            return {"+schema": dbt_project_obj["models"]["elementary"]["+schema"]}
+    dbt_project_obj = _parse_yaml_cached(dbt_project_yml, os.path.getmtime(dbt_project_yml))
+    if "elementary" not in dbt_project_obj["models"]:
         return None
+    if "schema" in dbt_project_obj["models"]["elementary"]:
+        return {"schema": dbt_project_obj["models"]["elementary"]["schema"]}
+    if "+schema" in dbt_project_obj["models"]["elementary"]:
+        return {"+schema": dbt_project_obj["models"]["elementary"]["+schema"]}
+    return None
 
 
 def get_elementary_package_version(packages_yml: str):
     """{'package': 'elementary-data/elementary', 'version': '0.15.2'}"""
-    with open(packages_yml, "r", encoding="utf-8") as packages_yml_f:  # skipcq: PTC-W6004
-        packages_obj = yaml.safe_load(packages_yml_f)
-        if (
-            packages_obj is not None
-            and "packages" in packages_obj
-            and isinstance(packages_obj["packages"], list)
-        ):
-            for package in packages_obj["packages"]:
-                if package["package"] == "elementary-data/elementary":
-                    return package
+    packages_obj = _parse_yaml_cached(packages_yml, os.path.getmtime(packages_yml))
+    if (
+        packages_obj is not None
+        and "packages" in packages_obj
+        and isinstance(packages_obj["packages"], list)
+    ):
+        for package in packages_obj["packages"]:
+            if package["package"] == "elementary-data/elementary":
+                return package
     return None
 
 
@@ -174,7 +191,7 @@ def create_elementary_tracking_tables(org: Org):
     return {"task_id": task_id, "hashkey": hashkey}
 
 
-def extract_profile_from_generate_elementary_cli_profile(lines: list[str]):
+def extract_profile_from_generate_elementary_cli_profile(lines: Sequence[str]):
     """skips the first few lines of the output until the profile yaml begins"""
     buffer = ""
     gather = False
@@ -190,7 +207,7 @@ def extract_profile_from_generate_elementary_cli_profile(lines: list[str]):
         )
         return {"error": "macro elementary.generate_elementary_cli_profile returned nothing"}, None
 
-    elementary_profile = yaml.safe_load(buffer)
+    elementary_profile = yaml.load(buffer, Loader=YamlSafeLoader)
     logger.info(elementary_profile)  # safe since there are no secrets here
     return None, elementary_profile
 
@@ -213,7 +230,7 @@ def create_elementary_profile(org: Org):
         text=True,
     )
 
-    error, elementary_profile = extract_profile_from_generate_elementary_cli_profile(r.split("\n"))
+    error, elementary_profile = extract_profile_from_generate_elementary_cli_profile(r.splitlines())
     if error:
         return error
 
@@ -223,7 +240,7 @@ def create_elementary_profile(org: Org):
         raise HttpError(400, dbt_project_filename + " is missing")
 
     with open(dbt_project_filename, "r", encoding="utf-8") as dbt_project_file:
-        dbt_project = yaml.safe_load(dbt_project_file)
+        dbt_project = yaml.load(dbt_project_file, Loader=YamlSafeLoader)
         if "profile" not in dbt_project:
             raise HttpError(400, "could not find 'profile:' in dbt_project.yml")
 
@@ -233,7 +250,7 @@ def create_elementary_profile(org: Org):
     # now we have to fix up the auth section by copying the dbt profile's auth section
     dbt_profile_file = Path(dbt_project_params.project_dir) / "profiles/profiles.yml"
     with open(dbt_profile_file, "r", encoding="utf-8") as dbt_profile_file_f:
-        dbt_profile = yaml.safe_load(dbt_profile_file_f)
+        dbt_profile = yaml.load(dbt_profile_file_f, Loader=YamlSafeLoader)
         logger.info("read dbt profile from %s", dbt_profile_file)
 
     target = elementary_profile["elementary"].get("target", "default")
@@ -345,37 +362,52 @@ def refresh_elementary_report_via_prefect(orguser: OrgUser) -> dict:
     return res
 
 
-def get_dbt_version(org: Org):
-    """get dbt version"""
-    try:
-        dbt_project_params = DbtProjectManager.gather_dbt_project_params(org, org.dbt)
-        dbt_version_command = [str(dbt_project_params.dbt_binary), "--version"]
-        dbt_output = subprocess.check_output(dbt_version_command, text=True)
-        for line in dbt_output.splitlines():
-            if "installed:" in line:
-                return line.split(":")[1].strip()
-        return "Not available"
-    except Exception as err:
-        logger.error("Error getting dbt version: %s", err)
-        return "Not available"
+def parse_dbt_version(dbt_output: str) -> str:
+    """parse the output of `dbt --version`"""
+    for line in dbt_output.splitlines():
+        if "installed:" in line:
+            return line.split(":")[1].strip()
+    return "Not available"
+
 
+def parse_edr_version(elementary_output: str) -> str:
+    """parse the output of `edr --version`"""
+    for line in elementary_output.splitlines():
+        if line.startswith("Elementary version"):
+            return line.split()[-1].strip()[:-1]
+    return "Not available"
 
-def get_edr_version(org: Org):
-    """get elementary report version"""
+
+def get_dbt_and_edr_versions(org: Org) -> tuple[str, str]:
+    """get the dbt and elementary versions, running both version commands concurrently"""
     try:
         dbt_project_params = DbtProjectManager.gather_dbt_project_params(org, org.dbt)
-        elementary_version_command = [
-            os.path.join(dbt_project_params.venv_binary, "edr"),
-            "--version",
-        ]
-        elementary_output = subprocess.check_output(elementary_version_command, text=True)
-        for line in elementary_output.splitlines():
-            if line.startswith("Elementary version"):
-                return line.split()[-1].strip()[:-1]
-        return "Not available"
     except Exception as err:
-        logger.error("Error getting elementary version: %s", err)
-        return "Not available"
+        logger.error("Error getting dbt project params: %s", err)
+        return "Not available", "Not available"
+
+    async def run_version_commands():
+        return await asyncio.gather(
+            runcmd_async([dbt_project_params.dbt_binary, "--version"]),
+            runcmd_async([os.path.join(dbt_project_params.venv_binary, "edr"), "--version"]),
+            return_exceptions=True,
+        )
+
+    dbt_output, elementary_output = asyncio.run(run_version_commands())
+
+    dbt_version = "Not available"
+    if isinstance(dbt_output, Exception):
+        logger.error("Error getting dbt version: %s", dbt_output)
+    else:
+        dbt_version = parse_dbt_version(dbt_output)
+
+    edr_version = "Not available"
+    if isinstance(elementary_output, Exception):
+        logger.error("Error getting elementary version: %s", elementary_output)
+    else:
+        edr_version = parse_edr_version(elementary_output)
+
+    return dbt_version, edr_version
 
 
 def create_edr_sendreport_dataflow(org: Org, org_task: OrgTask, cron: str):
@@ -247,6 +247,7 @@ class OrgDbtSchema(Schema):
     profile: DbtProfile
     gitrepoUrl: str
     gitrepoAccessToken: Optional[str]
+    gitrepoBranch: Optional[str]
 
 
 class OrgDbtGitHub(Schema):
@@ -254,6 +255,7 @@ class OrgDbtGitHub(Schema):
 
     gitrepoUrl: str
     gitrepoAccessToken: Optional[str]
+    gitrepoBranch: Optional[str]
 
 
 class OrgDbtTarget(Schema):
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-15 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ddpui", "0118_orgdataflowv1_meta"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="invitation",
+            name="invite_code",
+            field=models.CharField(max_length=36, unique=True),
+        ),
+    ]
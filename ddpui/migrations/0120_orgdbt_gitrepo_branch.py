@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-15 14:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ddpui", "0119_alter_invitation_invite_code"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="orgdbt",
+            name="gitrepo_branch",
+            field=models.CharField(max_length=255, null=True),
+        ),
+    ]
@@ -44,6 +44,8 @@ class OrgDbt(models.Model):
     gitrepo_access_token_secret = models.CharField(
         max_length=100, null=True
     )  # skipcq: PTC-W0901, PTC-W0906
+    # None means the repo's default branch
+    gitrepo_branch = models.CharField(max_length=255, null=True)
 
     project_dir = models.CharField(max_length=200)
     dbt_venv = models.CharField(max_length=200, null=True)
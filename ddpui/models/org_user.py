@@ -142,7 +142,7 @@ class Invitation(models.Model):
     )
     invited_by = models.ForeignKey(OrgUser, on_delete=models.CASCADE)
     invited_on = models.DateTimeField()
-    invite_code = models.CharField(max_length=36)
+    invite_code = models.CharField(max_length=36, unique=True)
     invited_new_role = models.ForeignKey(Role, on_delete=models.CASCADE, null=True)
     created_at = models.DateTimeField(auto_created=True, default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
@@ -0,0 +1,156 @@
+import os
+import json
+from types import SimpleNamespace
+import django
+
+from unittest.mock import Mock, patch
+import pytest
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ddpui.settings")
+os.environ["DJANGO_ALLOW_ASYNC_UNSAFE"] = "true"
+django.setup()
+
+from django.http import JsonResponse
+from ddpui.models.org import Org
+from ddpui.api.airbyte_api import (
+    get_request_org,
+    require_airbyte_service,
+    trigger_sync,
+    get_sync_task_result,
+)
+
+
+def make_request(org_id: int = 1, data: dict = None):
+    """a request from a user of the org with the given id"""
+    return SimpleNamespace(orguser=SimpleNamespace(org=Mock(id=org_id)), data=data or {})
+
+
+def test_get_request_org_from_orguser():
+    """the org the auth middleware attached is reused without a query"""
+    request = make_request()
+    with patch.object(Org, "objects") as objects_mock:
+        assert get_request_org(request, "1") is request.orguser.org
+    objects_mock.get.assert_not_called()
+
+
+def test_get_request_org_orguser_without_org():
+    """a user who doesn't belong to an org can't look one up"""
+    request = SimpleNamespace(orguser=SimpleNamespace(org=None))
+    with patch.object(Org, "objects") as objects_mock:
+        with pytest.raises(Org.DoesNotExist, match="the user does not belong to an organization"):
+            get_request_org(request, "1")
+    objects_mock.get.assert_not_called()
+
+
+@require_airbyte_service
+def airbyte_service_endpoint(request, airbyte_service):
+    """returns the airbyte service it was called with"""
+    return airbyte_service
+
+
+@patch("ddpui.api.airbyte_api.AirbyteService")
+@patch("ddpui.api.airbyte_api.get_request_org")
+def test_require_airbyte_service(get_request_org_mock: Mock, AirbyteService_mock: Mock):
+    """the endpoint gets the airbyte service of the requested org"""
+    request = make_request()
+
+    assert airbyte_service_endpoint(request, "1") is AirbyteService_mock.return_value
+    get_request_org_mock.assert_called_once_with(request, "1")
+    AirbyteService_mock.assert_called_once_with(get_request_org_mock.return_value)
+
+
+@patch("ddpui.api.airbyte_api.AirbyteService")
+@patch("ddpui.api.airbyte_api.get_request_org")
+def test_require_airbyte_service_org_not_found(
+    get_request_org_mock: Mock, AirbyteService_mock: Mock
+):
+    """a missing org is a bad request, and the endpoint is not called"""
+    get_request_org_mock.side_effect = Org.DoesNotExist("Org matching query does not exist.")
+
+    response = airbyte_service_endpoint(make_request(), "3")
+
+    assert isinstance(response, JsonResponse)
+    assert response.status_code == 400
+    assert json.loads(response.content) == {"error": "organization not found"}
+    AirbyteService_mock.assert_not_called()
+
+
+@patch("ddpui.api.airbyte_api.AirbyteService")
+@patch("ddpui.api.airbyte_api.trigger_airbyte_sync")
+def test_trigger_sync(trigger_airbyte_sync_mock: Mock, AirbyteService_mock: Mock):
+    """the sync is handed to a celery task whose id is returned"""
+    request = make_request(data={"connectionId": "fake-connection-id"})
+    AirbyteService_mock.return_value.org = request.orguser.org
+    trigger_airbyte_sync_mock.delay.return_value = Mock(id="fake-task-id")
+
+    response = trigger_sync(request, "1")
+
+    trigger_airbyte_sync_mock.delay.assert_called_once_with(1, "fake-connection-id")
+    assert json.loads(response.content) == {"task_id": "fake-task-id"}
+
+
+@patch("ddpui.api.airbyte_api.AirbyteService")
+@patch("ddpui.api.airbyte_api.AsyncResult")
+def test_get_sync_task_result_pending(AsyncResult_mock: Mock, AirbyteService_mock: Mock):
+    """a task which hasn't run yet only has a status"""
+    AirbyteService_mock.return_value.org = Mock(id=1)
+    AsyncResult_mock.return_value = Mock(status="PENDING", ready=Mock(return_value=False))
+
+    response = get_sync_task_result(make_request(), "1", "fake-task-id")
+
+    AsyncResult_mock.assert_called_once_with("fake-task-id")
+    assert json.loads(response.content) == {"status": "PENDING"}
+
+
+@patch("ddpui.api.airbyte_api.AirbyteService")
+@patch("ddpui.api.airbyte_api.AsyncResult")
+def test_get_sync_task_result_success(AsyncResult_mock: Mock, AirbyteService_mock: Mock):
+    """the airbyte job is returned once the task has run"""
+    AirbyteService_mock.return_value.org = Mock(id=1)
+    AsyncResult_mock.return_value = Mock(
+        status="SUCCESS",
+        ready=Mock(return_value=True),
+        failed=Mock(return_value=False),
+        result={"org_id": 1, "job": {"job": {"id": 10}}},
+    )
+
+    response = get_sync_task_result(make_request(), "1", "fake-task-id")
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {"status": "SUCCESS", "job": {"job": {"id": 10}}}
+
+
+@patch("ddpui.api.airbyte_api.AirbyteService")
+@patch("ddpui.api.airbyte_api.AsyncResult")
+def test_get_sync_task_result_other_org(AsyncResult_mock: Mock, AirbyteService_mock: Mock):
+    """a task triggered for another org is not found"""
+    AirbyteService_mock.return_value.org = Mock(id=1)
+    AsyncResult_mock.return_value = Mock(
+        status="SUCCESS",
+        ready=Mock(return_value=True),
+        failed=Mock(return_value=False),
+        result={"org_id": 2, "job": {"job": {"id": 10}}},
+    )
+
+    response = get_sync_task_result(make_request(), "1", "fake-task-id")
+
+    assert response.status_code == 404
+    assert json.loads(response.content) == {"error": "sync task not found"}
+
+
+@patch("ddpui.api.airbyte_api.AirbyteService")
+@patch("ddpui.api.airbyte_api.AsyncResult")
+def test_get_sync_task_result_failed(AsyncResult_mock: Mock, AirbyteService_mock: Mock):
+    """the task's error is returned if it failed"""
+    AirbyteService_mock.return_value.org = Mock(id=1)
+    AsyncResult_mock.return_value = Mock(
+        status="FAILURE",
+        ready=Mock(return_value=True),
+        failed=Mock(return_value=True),
+        result=Exception("airbyte is down"),
+    )
+
+    response = get_sync_task_result(make_request(), "1", "fake-task-id")
+
+    assert response.status_code == 500
+    assert json.loads(response.content) == {"status": "FAILURE", "error": "airbyte is down"}
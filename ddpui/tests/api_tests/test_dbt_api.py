@@ -113,7 +113,7 @@ def test_put_dbt_github(orguser):
     verifies that the celery task is called with the right parameters
     """
     request = mock_request(orguser)
-    orgdbt = OrgDbt.objects.create()
+    orgdbt = OrgDbt.objects.create(gitrepo_url="new-url", gitrepo_branch="dev")
     request.orguser.org.dbt = orgdbt
     request.orguser.org.save()
     request.orguser.org.slug = "org-slug"
@@ -140,9 +140,64 @@ def test_put_dbt_github(orguser):
             "new-access-token",
             os.getenv("CLIENTDBT_ROOT") + "/org-slug",
             None,
+            "dev",
         )
         assert request.orguser.org.dbt.gitrepo_url == "new-url"
         assert request.orguser.org.dbt.gitrepo_access_token_secret == "new-access-token"
+        assert request.orguser.org.dbt.gitrepo_branch == "dev"
+
+
+def test_put_dbt_github_new_branch(orguser):
+    """a branch in the payload replaces the stored one and is cloned"""
+    request = mock_request(orguser)
+    request.orguser.org.dbt = OrgDbt.objects.create(gitrepo_branch="dev")
+    request.orguser.org.save()
+
+    payload = OrgDbtGitHub(
+        gitrepoUrl="new-url", gitrepoAccessToken="*******", gitrepoBranch="release"
+    )
+
+    with patch(
+        "ddpui.celeryworkers.tasks.clone_github_repo.delay", return_value=Mock(id="task-id")
+    ) as delay, patch("ddpui.api.dbt_api.dbt_service.check_repo_exists", return_value=True):
+        put_dbt_github(request, payload)
+
+    assert delay.call_args.args[-1] == "release"
+    assert OrgDbt.objects.get(id=request.orguser.org.dbt.id).gitrepo_branch == "release"
+
+
+def test_put_dbt_github_reset_branch(orguser):
+    """an empty branch in the payload goes back to the repo's default branch"""
+    request = mock_request(orguser)
+    request.orguser.org.dbt = OrgDbt.objects.create(gitrepo_url="new-url", gitrepo_branch="dev")
+    request.orguser.org.save()
+
+    payload = OrgDbtGitHub(gitrepoUrl="new-url", gitrepoAccessToken="*******", gitrepoBranch="")
+
+    with patch(
+        "ddpui.celeryworkers.tasks.clone_github_repo.delay", return_value=Mock(id="task-id")
+    ) as delay, patch("ddpui.api.dbt_api.dbt_service.check_repo_exists", return_value=True):
+        put_dbt_github(request, payload)
+
+    assert delay.call_args.args[-1] is None
+    assert OrgDbt.objects.get(id=request.orguser.org.dbt.id).gitrepo_branch is None
+
+
+def test_put_dbt_github_new_repo_clears_branch(orguser):
+    """the stored branch is not carried over to a different repo"""
+    request = mock_request(orguser)
+    request.orguser.org.dbt = OrgDbt.objects.create(gitrepo_url="old-url", gitrepo_branch="dev")
+    request.orguser.org.save()
+
+    payload = OrgDbtGitHub(gitrepoUrl="new-url", gitrepoAccessToken="*******")
+
+    with patch(
+        "ddpui.celeryworkers.tasks.clone_github_repo.delay", return_value=Mock(id="task-id")
+    ) as delay, patch("ddpui.api.dbt_api.dbt_service.check_repo_exists", return_value=True):
+        put_dbt_github(request, payload)
+
+    assert delay.call_args.args[-1] is None
+    assert OrgDbt.objects.get(id=request.orguser.org.dbt.id).gitrepo_branch is None
 
 
 def test_dbt_delete_no_org(orguser):
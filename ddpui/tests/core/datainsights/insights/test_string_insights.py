@@ -213,23 +213,6 @@ def test_string_length_stats_query_validate_results(
     assert string_length_stats_query.validate_query_results(result_to_be_validated)
 
 
-def test_string_length_stats_query_validate_results(
-    string_length_stats_query: StringLengthStats,
-):
-    """Success test case of validating the parsed results of the query"""
-    mock_results = [
-        {
-            "mean": Decimal(1.2),
-            "median": Decimal(1.5),
-            "mode": Decimal(2),
-            "other_modes": [],
-        }
-    ]
-    mock_output = string_length_stats_query.parse_results(mock_results)
-    result_to_be_validated = mock_output[string_length_stats_query.columns[0].name]
-    assert string_length_stats_query.validate_query_results(result_to_be_validated)
-
-
 def test_string_length_stats_query_uniqueness_of_query_id(
     string_length_stats_query: StringLengthStats,
 ):
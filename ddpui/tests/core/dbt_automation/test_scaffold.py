@@ -0,0 +1,173 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ddpui.dbt_automation.operations.scaffold import (
+    get_dbt_requirements,
+    layer_venv,
+    relocate_venv,
+    setup_dbt_venv,
+)
+
+SITE_PACKAGES = (
+    Path("lib") / f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages"
+)
+REQUIREMENTS = ["dbt-core==1.8.7", "dbt-postgres==1.8.2"]
+CACHE_KEY = f"py{sys.version_info.major}{sys.version_info.minor}-dbt-core-1.8.7-dbt-postgres-1.8.2"
+
+
+def fake_check_call(cmd):
+    """creates the files `python -m venv` and `pip install dbt-...` would, without running them"""
+    if cmd[1:3] == ["-m", "venv"]:
+        venv_dir = Path(cmd[-1])
+        (venv_dir / "bin").mkdir(parents=True)
+        (venv_dir / SITE_PACKAGES).mkdir(parents=True)
+        (venv_dir / "bin" / "activate").write_text(f'VIRTUAL_ENV="{venv_dir}"\n')
+        (venv_dir / "bin" / "python").symlink_to(sys.executable)
+    else:
+        venv_dir = Path(cmd[0]).parent.parent
+        (venv_dir / "bin" / "dbt").write_text(f"#!{venv_dir}/bin/python\nimport dbt\n")
+        # like the daff.py script agate pulls in
+        (venv_dir / "bin" / "__pycache__").mkdir()
+        (venv_dir / "bin" / "__pycache__" / "daff.cpython-310.pyc").write_bytes(b"")
+    return 0
+
+
+@pytest.fixture
+def venv_cache(tmp_path):
+    """DBT_VENV_CACHE pointing at an empty directory, with REQUIREMENTS installed here"""
+    cache_dir = tmp_path / "cache"
+    with patch.dict(os.environ, {"DBT_VENV_CACHE": str(cache_dir)}), patch(
+        "ddpui.dbt_automation.operations.scaffold.get_dbt_requirements", return_value=REQUIREMENTS
+    ):
+        yield cache_dir
+
+
+@patch("ddpui.dbt_automation.operations.scaffold.subprocess.check_call")
+def test_setup_dbt_venv_cache_miss(mock_check_call, venv_cache, tmp_path):
+    """the base venv is built, moved into the cache and the project venv is layered on it"""
+    mock_check_call.side_effect = fake_check_call
+
+    setup_dbt_venv(tmp_path / "project" / "venv", "postgres")
+
+    cached_venv_dir = venv_cache / CACHE_KEY
+    assert os.listdir(venv_cache) == [CACHE_KEY]
+    assert mock_check_call.call_args_list[1].args[0][-2:] == REQUIREMENTS
+    # the cached venv's scripts point at the cache, not at the directory it was built in
+    assert (cached_venv_dir / "bin" / "dbt").read_text().startswith(f"#!{cached_venv_dir}/bin/")
+    assert (tmp_path / "project" / "venv" / SITE_PACKAGES / "dbt_base_venv.pth").exists()
+
+
+@patch("ddpui.dbt_automation.operations.scaffold.subprocess.check_call")
+def test_setup_dbt_venv_cache_hit(mock_check_call, venv_cache, tmp_path):
+    """a cached base venv is reused without installing anything"""
+    mock_check_call.side_effect = fake_check_call
+    fake_check_call([sys.executable, "-m", "venv", venv_cache / CACHE_KEY])
+    fake_check_call([venv_cache / CACHE_KEY / "bin" / "pip", "install", *REQUIREMENTS])
+
+    setup_dbt_venv(tmp_path / "project" / "venv", "postgres")
+
+    mock_check_call.assert_called_once_with(
+        [sys.executable, "-m", "venv", "--without-pip", (tmp_path / "project" / "venv")]
+    )
+    assert (tmp_path / "project" / "venv" / "bin" / "dbt").exists()
+
+
+@patch("ddpui.dbt_automation.operations.scaffold.subprocess.check_call")
+def test_setup_dbt_venv_failed_install(mock_check_call, venv_cache, tmp_path):
+    """a venv whose install failed is removed and never written to the cache"""
+
+    def failing_pip(cmd):
+        if cmd[1:3] == ["-m", "venv"]:
+            return fake_check_call(cmd)
+        raise subprocess.CalledProcessError(1, cmd)
+
+    mock_check_call.side_effect = failing_pip
+
+    with pytest.raises(subprocess.CalledProcessError):
+        setup_dbt_venv(tmp_path / "project" / "venv", "postgres")
+
+    assert os.listdir(venv_cache) == []
+    assert not (tmp_path / "project" / "venv").exists()
+
+
+@patch("ddpui.dbt_automation.operations.scaffold.subprocess.check_call")
+def test_setup_dbt_venv_without_cache(mock_check_call, tmp_path):
+    """without DBT_VENV_CACHE the project gets its own venv with the pinned dbt"""
+    mock_check_call.side_effect = fake_check_call
+    venv_dir = tmp_path / "venv"
+
+    with patch.dict(os.environ, {"DBT_VENV_CACHE": ""}), patch(
+        "ddpui.dbt_automation.operations.scaffold.get_dbt_requirements", return_value=REQUIREMENTS
+    ):
+        setup_dbt_venv(venv_dir, "postgres")
+
+    assert mock_check_call.call_args_list[1].args[0] == [
+        venv_dir / "bin" / "pip",
+        "install",
+        *REQUIREMENTS,
+    ]
+
+
+@patch("ddpui.dbt_automation.operations.scaffold.subprocess.check_call")
+def test_setup_dbt_venv_dbt_not_installed(mock_check_call, venv_cache, tmp_path):
+    """if dbt isn't installed here the latest adapter is installed and nothing is cached"""
+    mock_check_call.side_effect = fake_check_call
+    venv_dir = tmp_path / "venv"
+
+    with patch("ddpui.dbt_automation.operations.scaffold.get_dbt_requirements", return_value=None):
+        setup_dbt_venv(venv_dir, "postgres")
+
+    assert mock_check_call.call_args_list[1].args[0] == [
+        venv_dir / "bin" / "pip",
+        "install",
+        "dbt-postgres",
+    ]
+    assert not venv_cache.exists()
+
+
+@patch("ddpui.dbt_automation.operations.scaffold.importlib.metadata.version")
+def test_get_dbt_requirements(mock_version):
+    """dbt-core and the adapter are pinned to the versions installed here"""
+    mock_version.side_effect = {"dbt-core": "1.8.7", "dbt-postgres": "1.8.2"}.get
+
+    assert get_dbt_requirements("postgres") == REQUIREMENTS
+
+
+@patch("ddpui.dbt_automation.operations.scaffold.subprocess.check_call")
+def test_layer_venv(mock_check_call, tmp_path):
+    """the layered venv sees the base venv's site-packages and runs its scripts itself"""
+    mock_check_call.side_effect = fake_check_call
+    base_venv_dir = tmp_path / "base"
+    fake_check_call([sys.executable, "-m", "venv", base_venv_dir])
+    fake_check_call([base_venv_dir / "bin" / "pip", "install", "dbt-postgres"])
+    venv_dir = tmp_path / "venv"
+
+    layer_venv(venv_dir, base_venv_dir)
+
+    pth = (venv_dir / SITE_PACKAGES / "dbt_base_venv.pth").read_text()
+    assert pth == f"{base_venv_dir / SITE_PACKAGES}\n"
+    assert (venv_dir / "bin" / "dbt").read_text() == f"#!{venv_dir}/bin/python\nimport dbt\n"
+    # the venv's own activate script is kept
+    assert (venv_dir / "bin" / "activate").read_text() == f'VIRTUAL_ENV="{venv_dir}"\n'
+    # directories under bin/ are not copied
+    assert not (venv_dir / "bin" / "__pycache__").exists()
+
+
+def test_relocate_venv(tmp_path):
+    """shebangs and the activate script are rewritten, symlinks are left alone"""
+    old_venv_dir = tmp_path / "old"
+    new_venv_dir = tmp_path / "new"
+    fake_check_call([sys.executable, "-m", "venv", old_venv_dir])
+    fake_check_call([old_venv_dir / "bin" / "pip", "install", "dbt-postgres"])
+
+    relocate_venv(old_venv_dir, old_venv_dir, new_venv_dir)
+
+    bin_dir = old_venv_dir / "bin"
+    assert (bin_dir / "dbt").read_text() == f"#!{new_venv_dir}/bin/python\nimport dbt\n"
+    assert (bin_dir / "activate").read_text() == f'VIRTUAL_ENV="{new_venv_dir}"\n'
+    assert os.readlink(bin_dir / "python") == sys.executable
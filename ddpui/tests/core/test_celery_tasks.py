@@ -1,4 +1,5 @@
 import os
+import shlex
 from pathlib import Path
 import django
 import pytest
@@ -22,9 +23,11 @@ from ddpui.tests.api_tests.test_user_org_api import (
 )
 from ddpui.ddpprefect.schema import DbtProfile, OrgDbtSchema
 from ddpui.celeryworkers.tasks import (
+    clone_github_repo,
     setup_dbtworkspace,
     detect_schema_changes_for_org,
     get_connection_catalog_task,
+    trigger_airbyte_sync,
 )
 from ddpui.models.tasks import TaskProgressStatus
 from ddpui.core.dbtautomation_service import sync_sources_for_warehouse
@@ -100,6 +103,7 @@ def test_post_dbt_workspace_success(orguser, tmp_path):
     payload = OrgDbtSchema(
         profile=dbtprofile,
         gitrepoUrl="gitrepoUrl",
+        gitrepoBranch="dev",
     )
 
     with patch.object(TaskProgress, "__init__", return_value=None), patch.object(
@@ -116,7 +120,9 @@ def test_post_dbt_workspace_success(orguser, tmp_path):
 
         add_progress_mock.assert_has_calls([call({"message": "started", "status": "running"})])
         gitclone_method_mock.assert_called_once()
+        assert gitclone_method_mock.call_args.args[-1] == "dev"
         assert OrgDbt.objects.filter(org=orguser.org).count() == 1
+        assert OrgDbt.objects.get(org=orguser.org).gitrepo_branch == "dev"
         add_progress_mock.assert_has_calls(
             [
                 call({"message": "started", "status": "running"}),
@@ -125,6 +131,133 @@ def test_post_dbt_workspace_success(orguser, tmp_path):
         )
 
 
+def fake_git_clone(gitmodules=False, submodule_error=False):
+    """a runcmd which creates the clone's directory, as `git clone` would"""
+
+    def fake_runcmd(cmd, cwd):
+        if cmd.startswith("git submodule") and submodule_error:
+            raise Exception("could not read from remote repository")
+        if cmd.startswith("git clone"):
+            (cwd / cmd.split()[-1]).mkdir()
+            if gitmodules:
+                (cwd / cmd.split()[-1] / ".gitmodules").write_text("", encoding="utf-8")
+
+    return fake_runcmd
+
+
+def test_clone_github_repo_shallow(tmp_path):
+    """the dbt repo is cloned without its history; no sparse_paths => full tree"""
+    org_dir = tmp_path / "org-slug"
+    with patch(
+        "ddpui.celeryworkers.tasks.runcmd", side_effect=fake_git_clone()
+    ) as runcmd_mock, patch("ddpui.celeryworkers.tasks.uuid4", return_value=Mock(hex="abc")):
+        dbtrepo_dir = clone_github_repo("org-slug", "gitrepoUrl", None, str(org_dir), Mock())
+    assert dbtrepo_dir == org_dir / "dbtrepo"
+    assert dbtrepo_dir.exists()
+    runcmd_mock.assert_has_calls(
+        [
+            call(
+                "git clone --depth 1 --single-branch --filter=blob:none --sparse gitrepoUrl dbtrepo.staging-abc",
+                org_dir,
+            ),
+            call("git sparse-checkout disable", org_dir / "dbtrepo.staging-abc"),
+        ]
+    )
+
+
+def test_clone_github_repo_shallow_branch_sparse_paths(tmp_path):
+    """a specific branch can be cloned and the checkout restricted to the given paths"""
+    org_dir = tmp_path / "org-slug"
+    with patch(
+        "ddpui.celeryworkers.tasks.runcmd", side_effect=fake_git_clone()
+    ) as runcmd_mock, patch("ddpui.celeryworkers.tasks.uuid4", return_value=Mock(hex="abc")):
+        clone_github_repo(
+            "org-slug", "gitrepoUrl", None, str(org_dir), Mock(), "main", ["dbt/models"]
+        )
+    runcmd_mock.assert_has_calls(
+        [
+            call(
+                "git clone --depth 1 --single-branch --filter=blob:none --sparse --branch main gitrepoUrl dbtrepo.staging-abc",
+                org_dir,
+            ),
+            call("git sparse-checkout set dbt/models", org_dir / "dbtrepo.staging-abc"),
+        ]
+    )
+
+
+def test_clone_github_repo_branch_is_quoted(tmp_path):
+    """the branch name reaches git as a single argument"""
+    org_dir = tmp_path / "org-slug"
+    with patch(
+        "ddpui.celeryworkers.tasks.runcmd", side_effect=fake_git_clone()
+    ) as runcmd_mock, patch("ddpui.celeryworkers.tasks.uuid4", return_value=Mock(hex="abc")):
+        clone_github_repo("org-slug", "gitrepoUrl", None, str(org_dir), Mock(), "x; rm -rf y")
+    clone_cmd = runcmd_mock.call_args_list[0].args[0]
+    assert shlex.split(clone_cmd)[-3:] == ["x; rm -rf y", "gitrepoUrl", "dbtrepo.staging-abc"]
+
+
+def test_clone_github_repo_submodules(tmp_path):
+    """submodules are fetched only if the repo has any"""
+    org_dir = tmp_path / "org-slug"
+    with patch(
+        "ddpui.celeryworkers.tasks.runcmd", side_effect=fake_git_clone(gitmodules=True)
+    ) as runcmd_mock, patch("ddpui.celeryworkers.tasks.os.cpu_count", return_value=8), patch(
+        "ddpui.celeryworkers.tasks.uuid4", return_value=Mock(hex="abc")
+    ):
+        clone_github_repo("org-slug", "gitrepoUrl", None, str(org_dir), Mock())
+    runcmd_mock.assert_called_with(
+        "git submodule update --init --recursive --depth 1 --jobs 8",
+        org_dir / "dbtrepo.staging-abc",
+    )
+    assert (org_dir / "dbtrepo" / ".gitmodules").exists()
+
+
+def test_clone_github_repo_submodules_failure(tmp_path):
+    """a submodule which can't be fetched doesn't fail the clone"""
+    org_dir = tmp_path / "org-slug"
+    taskprogress = Mock()
+    with patch(
+        "ddpui.celeryworkers.tasks.runcmd",
+        side_effect=fake_git_clone(gitmodules=True, submodule_error=True),
+    ):
+        dbtrepo_dir = clone_github_repo("org-slug", "gitrepoUrl", None, str(org_dir), taskprogress)
+    assert dbtrepo_dir == org_dir / "dbtrepo"
+    assert (org_dir / "dbtrepo" / ".gitmodules").exists()
+    taskprogress.add.assert_any_call(
+        {"message": "could not fetch the git submodules", "status": "running"}
+    )
+    assert taskprogress.add.call_args[0][0]["message"] == "cloned git repo"
+
+
+def test_clone_github_repo_replaces_old_clone(tmp_path):
+    """an existing clone is moved aside and deleted in the background"""
+    org_dir = tmp_path / "org-slug"
+    (org_dir / "dbtrepo").mkdir(parents=True)
+    (org_dir / "dbtrepo" / "old").write_text("", encoding="utf-8")
+    with patch("ddpui.celeryworkers.tasks.runcmd", side_effect=fake_git_clone()), patch(
+        "ddpui.celeryworkers.tasks.delete_tree.apply_async"
+    ) as delete_tree_mock:
+        clone_github_repo("org-slug", "gitrepoUrl", None, str(org_dir), Mock())
+    assert (org_dir / "dbtrepo").exists()
+    assert not (org_dir / "dbtrepo" / "old").exists()
+    trash_dir = delete_tree_mock.call_args.kwargs["args"][0]
+    assert Path(trash_dir).parent == org_dir
+    assert Path(trash_dir).name.startswith(".trash-")
+    assert (Path(trash_dir) / "old").exists()
+
+
+def test_clone_github_repo_failure_keeps_old_clone(tmp_path):
+    """a failed clone leaves the existing one in place"""
+    org_dir = tmp_path / "org-slug"
+    (org_dir / "dbtrepo").mkdir(parents=True)
+    (org_dir / "dbtrepo" / "old").write_text("", encoding="utf-8")
+    with patch("ddpui.celeryworkers.tasks.runcmd", side_effect=Exception("clone failed")), patch(
+        "ddpui.celeryworkers.tasks.delete_tree.apply_async"
+    ):
+        assert clone_github_repo("org-slug", "gitrepoUrl", None, str(org_dir), Mock()) is None
+    assert (org_dir / "dbtrepo" / "old").exists()
+
+
 def test_sync_sources_failed_to_connect_to_warehouse(orguser: OrgUser, tmp_path):
     """a failure test for sync sources when not able to establish connection to client warehouse"""
     warehouse = OrgWarehouse.objects.create(
@@ -456,3 +589,20 @@ def test_get_connection_catalog_task_success(org_without_workspace: Org):
             },
         },
     ]
+
+
+def test_trigger_airbyte_sync_org_not_found():
+    """no sync is triggered for an org which doesn't exist"""
+    with patch("ddpui.celeryworkers.tasks.airbyte_service.AirbyteService") as AirbyteService_mock:
+        assert trigger_airbyte_sync(-1, "fake-connection-id") is None
+    AirbyteService_mock.assert_not_called()
+
+
+def test_trigger_airbyte_sync_success(org_without_workspace: Org):
+    """the airbyte job is returned along with the org it was triggered for"""
+    with patch("ddpui.celeryworkers.tasks.airbyte_service.AirbyteService") as AirbyteService_mock:
+        AirbyteService_mock.return_value.trigger_sync.return_value = {"job": {"id": 1}}
+        result = trigger_airbyte_sync(org_without_workspace.id, "fake-connection-id")
+    AirbyteService_mock.assert_called_once_with(org_without_workspace)
+    AirbyteService_mock.return_value.trigger_sync.assert_called_once_with("fake-connection-id")
+    assert result == {"org_id": org_without_workspace.id, "job": {"job": {"id": 1}}}
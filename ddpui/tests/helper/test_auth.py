@@ -170,6 +170,20 @@ def test_authenticate_org_user_success(org_user_accountmanager: OrgUser):
     assert response.orguser == org_user_accountmanager
 
 
+def test_authenticate_org_user_num_queries(
+    org_user_accountmanager: OrgUser, django_assert_num_queries
+):
+    """the token, user, orguser and org are fetched in two queries"""
+    test_token = token(org_user_accountmanager.user)
+    request = Mock(headers={})
+    allowed_roles = [org_user_accountmanager.role]
+
+    with django_assert_num_queries(2):
+        response = authenticate_org_user(request, test_token.key, allowed_roles, True)
+        assert response.orguser.org.slug == "temp-org"
+        assert response.user.username == org_user_accountmanager.user.username
+
+
 @pytest.fixture
 def anotherorg():
     temp_org = Org.objects.create(name="another-temp-org", slug="another-temp-org")
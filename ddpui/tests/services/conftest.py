@@ -0,0 +1,29 @@
+import sys
+
+import pytest
+
+# the functions the services cache in-process, as (module, attribute path)
+CACHED_FUNCTIONS = [
+    ("ddpui.ddpdbt.elementary_service", "_parse_yaml_cached"),
+    ("ddpui.ddpairbyte.airbyte_service", "AirbyteService.list_source_definitions"),
+    ("ddpui.ddpairbyte.airbyte_service", "AirbyteService.get_source_definition_specifications"),
+    (
+        "ddpui.ddpairbyte.airbyte_service",
+        "AirbyteService.get_destination_definition_specifications",
+    ),
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_service_caches():
+    """empty the in-process caches of the services after each test, so no test sees another's"""
+    yield
+    # only modules a test has already imported can have anything cached, and looking them up
+    # in sys.modules keeps a module which fails to import from failing every test here
+    for module_name, attribute_path in CACHED_FUNCTIONS:
+        cached = sys.modules.get(module_name)
+        for attribute in attribute_path.split("."):
+            cached = getattr(cached, attribute, None)
+        cache_clear = getattr(cached, "cache_clear", None)
+        if cache_clear is not None:
+            cache_clear()
@@ -1,21 +1,23 @@
+import pickle
 from pathlib import Path
-from unittest.mock import patch, Mock, mock_open, MagicMock, ANY
+from types import SimpleNamespace
+from typing import Final
+from unittest.mock import patch, call, Mock, MagicMock, ANY, DEFAULT
 import pytest
 from django.contrib.auth.models import User
 from ddpui import settings
 from ddpui.models.org import Org, OrgDbt, OrgDataFlowv1
 from ddpui.models.org_user import OrgUser
 from ddpui.models.tasks import OrgTask, Task, DataflowOrgTask, TaskProgressHashPrefix
+from ddpui.ddpdbt import elementary_service as _es
 from ddpui.ddpdbt.elementary_service import (
     elementary_setup_status,
-    get_elementary_target_schema,
-    get_elementary_package_version,
     check_dbt_files,
     create_elementary_tracking_tables,
-    extract_profile_from_generate_elementary_cli_profile,
     refresh_elementary_report_via_prefect,
-    get_dbt_version,
-    get_edr_version,
+    parse_dbt_version,
+    parse_edr_version,
+    get_dbt_and_edr_versions,
     create_edr_sendreport_dataflow,
 )
 from ddpui.utils.constants import TASK_GENERATE_EDR
@@ -24,35 +26,93 @@ from ddpui.ddpprefect.schema import (
     PrefectDataFlowCreateSchema3,
 )
 
-pytestmark = pytest.mark.django_db
+# the deployment create_edr_sendreport_dataflow makes for the test-org fixtures and hash "hashcode"
+EDR_DEPLOYMENT_NAME: Final = "pipeline-test-org-generate-edr-hashcode"
 
 
-@pytest.fixture
-def org_dbt():
+# these rows are only read by the tests, so they are created once for the module
+# instead of once per test. each test still runs in its own transaction
+# they are created outside of any transaction, so with --reuse-db a run which was aborted
+# before the teardown leaves them behind; each fixture first deletes such leftovers
+@pytest.fixture(scope="module")
+def org_dbt(django_db_setup, django_db_blocker):
     """org dbt"""
-    return OrgDbt.objects.create(
-        project_dir="test-project-dir",
-        target_type="tgt_type",
-        default_schema="test-default_schema",
-    )
+    with django_db_blocker.unblock():
+        OrgDbt.objects.filter(project_dir="test-project-dir").delete()
+        orgdbt = OrgDbt.objects.create(
+            project_dir="test-project-dir",
+            target_type="tgt_type",
+            default_schema="test-default_schema",
+        )
+    yield orgdbt
+    with django_db_blocker.unblock():
+        orgdbt.delete()
+
+
+@pytest.fixture(scope="module")
+def org(org_dbt, django_db_blocker):
+    """org with dbt"""
+    with django_db_blocker.unblock():
+        Org.objects.filter(slug="test-org").delete()
+        testorg = Org.objects.create(slug="test-org", dbt=org_dbt)
+    yield testorg
+    with django_db_blocker.unblock():
+        testorg.delete()
+
+
+@pytest.fixture(scope="module")
+def authuser(django_db_setup, django_db_blocker):
+    """auth user"""
+    with django_db_blocker.unblock():
+        User.objects.filter(username="fake-username").delete()
+        user = User.objects.create(email="fake-email", username="fake-username")
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
+
+
+@pytest.fixture(scope="module")
+def pickled_orguser(org, authuser, django_db_blocker):
+    """org user, pickled together with its org and user"""
+    with django_db_blocker.unblock():
+        testorguser = OrgUser.objects.create(org=org, user=authuser)
+    yield pickle.dumps(testorguser)
+    with django_db_blocker.unblock():
+        testorguser.delete()
 
 
 @pytest.fixture
-def org(org_dbt):
-    """org with dbt"""
-    return Org.objects.create(slug="test-org", dbt=org_dbt)
+def orguser(pickled_orguser):
+    """a copy of the module's org user for each test, unaffected by changes made in other tests"""
+    return pickle.loads(pickled_orguser)
 
 
 @pytest.fixture
-def authuser():
-    """auth user"""
-    return User.objects.create(email="fake-email", username="fake-username")
+def org_mock():
+    """an org with dbt which is not in the db, for tests which don't query it"""
+    return Mock(
+        spec=Org,
+        id=1,
+        slug="test-org",
+        dbt=Mock(spec=OrgDbt, project_dir="test-project-dir"),
+    )
 
 
 @pytest.fixture
-def orguser(org, authuser):
-    """org user"""
-    return OrgUser.objects.create(org=org, user=authuser)
+def dbt_task_mocks():
+    """patches what elementary_service uses to queue dbt commands; uuid4 returns test-uuid"""
+    with patch.multiple(
+        _es,
+        TaskProgress=DEFAULT,
+        uuid4=DEFAULT,
+        run_dbt_commands=DEFAULT,
+    ) as mocks:
+        mocks["uuid4"].return_value = "test-uuid"
+        yield SimpleNamespace(
+            task_progress=mocks["TaskProgress"],
+            uuid4=mocks["uuid4"],
+            run_dbt_commands=mocks["run_dbt_commands"],
+        )
 
 
 @pytest.fixture
@@ -97,144 +157,54 @@ def edr_deployment_org():
     dataflow.delete()
 
 
-@patch("ddpui.ddpdbt.elementary_service.DbtProjectManager")
+@pytest.mark.django_db
+@patch.object(_es, "DbtProjectManager")
 def test_elementary_setup_status_success(dbt_project_manager, edr_deployment_org):
     """tests elementary_setup_status"""
-    dbt_project_manager.get_dbt_project_dir = Mock(return_value=Path("test-project-dir"))
-    with patch("ddpui.ddpdbt.elementary_service.os.path.exists", return_value=True):
+    dbt_project_manager.get_dbt_project_dir.return_value = Path("test-project-dir")
+    with patch.object(_es.os.path, "exists", return_value=True):
         result = elementary_setup_status(edr_deployment_org)
 
-        dbt_project_manager.get_dbt_project_dir.assert_called_once_with(edr_deployment_org.dbt)
+        assert dbt_project_manager.mock_calls == [call.get_dbt_project_dir(edr_deployment_org.dbt)]
 
         assert result == {"status": "set-up"}
 
 
-@patch("ddpui.ddpdbt.elementary_service.DbtProjectManager")
-@patch("ddpui.ddpdbt.elementary_service.os.path.exists")
+@pytest.mark.django_db
+@patch.object(_es, "DbtProjectManager")
+@patch.object(_es.os.path, "exists")
 def test_elementary_setup_status_no_edr_deployment_found(
     mock_os_path_exists, dbt_project_manager, org
 ):
     """tests elementary_setup_status"""
-    dbt_project_manager.get_dbt_project_dir = Mock(return_value="test-project-dir")
+    dbt_project_manager.get_dbt_project_dir.return_value = "test-project-dir"
     mock_os_path_exists.return_value = True
 
     result = elementary_setup_status(org)
     assert result == {"status": "not-set-up"}
 
-    dbt_project_manager.get_dbt_project_dir.assert_called_once_with(org.dbt)
-    mock_os_path_exists.assert_called_once_with(
-        Path("test-project-dir/elementary_profiles/profiles.yml")
-    )
+    assert dbt_project_manager.mock_calls == [call.get_dbt_project_dir(org.dbt)]
+    assert mock_os_path_exists.mock_calls == [
+        call(Path("test-project-dir/elementary_profiles/profiles.yml"))
+    ]
 
 
-def test_elementary_setup_status_no_dbt(org):
+def test_elementary_setup_status_no_dbt(org_mock):
     """tests elementary_setup_status when dbt is not configured"""
-    org.dbt = None
-    result = elementary_setup_status(org)
+    org_mock.dbt = None
+    result = elementary_setup_status(org_mock)
     assert result == {"error": "dbt is not configured for this client"}
 
 
-def test_get_elementary_target_schema_schema():
-    """tests get_elementary_target_schema"""
-    dbt_project_content = """
-    models:
-      elementary:
-        schema: elementary
-    """
-    with patch("builtins.open", mock_open(read_data=dbt_project_content)):
-        result = get_elementary_target_schema("dbt_project.yml")
-        assert result == {"schema": "elementary"}
-
-
-def test_get_elementary_target_schema_plus_schema():
-    """tests get_elementary_target_schema"""
-    dbt_project_content = """
-    models:
-      elementary:
-        +schema: elementary
-    """
-    with patch("builtins.open", mock_open(read_data=dbt_project_content)):
-        result = get_elementary_target_schema("dbt_project.yml")
-        assert result == {"+schema": "elementary"}
-
-
-def test_get_elementary_target_schema_no_elementary():
-    """tests get_elementary_target_schema"""
-    dbt_project_content = """
-    models:
-      not_elementary:
-        schema: not_elementary
-    """
-    with patch("builtins.open", mock_open(read_data=dbt_project_content)):
-        result = get_elementary_target_schema("dbt_project.yml")
-        assert result is None
-
-
-def test_get_elementary_target_schema_no_schema():
-    """tests get_elementary_target_schema"""
-    dbt_project_content = """
-    models:
-      elementary:
-        other_key: other_value
-    """
-    with patch("builtins.open", mock_open(read_data=dbt_project_content)):
-        result = get_elementary_target_schema("dbt_project.yml")
-        assert result is None
-
-
-def test_get_elementary_package_version_found():
-    """tests get_elementary_package_version"""
-    packages_content = """
-    packages:
-      - package: elementary-data/elementary
-        version: 0.15.2
-    """
-    with patch("builtins.open", mock_open(read_data=packages_content)):
-        result = get_elementary_package_version("packages.yml")
-        assert result == {"package": "elementary-data/elementary", "version": "0.15.2"}
-
-
-def test_get_elementary_package_version_not_found():
-    """tests get_elementary_package_version"""
-    packages_content = """
-    packages:
-      - package: other-package
-        version: 1.0.0
-    """
-    with patch("builtins.open", mock_open(read_data=packages_content)):
-        result = get_elementary_package_version("packages.yml")
-        assert result is None
-
-
-def test_get_elementary_package_version_no_packages_key():
-    """tests get_elementary_package_version"""
-    packages_content = """
-    other_key:
-      - package: elementary-data/elementary
-        version: 0.15.2
-    """
-    with patch("builtins.open", mock_open(read_data=packages_content)):
-        result = get_elementary_package_version("packages.yml")
-        assert result is None
-
-
-def test_get_elementary_package_version_empty_file():
-    """tests get_elementary_package_version"""
-    packages_content = ""
-    with patch("builtins.open", mock_open(read_data=packages_content)):
-        result = get_elementary_package_version("packages.yml")
-        assert result is None
-
-
-@patch("ddpui.ddpdbt.elementary_service.DbtProjectManager.gather_dbt_project_params")
-@patch("ddpui.ddpdbt.elementary_service.Path")
+@patch.object(_es.DbtProjectManager, "gather_dbt_project_params")
+@patch.object(_es, "Path")
 def test_check_dbt_files_missing_packages_yml(
     mock_path,
     mock_gather_dbt_project_params,
-    org,
+    org_mock,
 ):
     """tests check_dbt_files"""
-    mock_gather_dbt_project_params.retval = Mock(project_dir="test-project-dir")
+    mock_gather_dbt_project_params.return_value.project_dir = "test-project-dir"
 
     mock_dbt_project_yml = MagicMock()
     mock_dbt_project_yml.__str__.return_value = "dbt_project.yml"
@@ -250,22 +220,22 @@ def test_check_dbt_files_missing_packages_yml(
     mock_dbt_project_yml.exists.return_value = True
     mock_packages_yml.exists.return_value = False
 
-    response = check_dbt_files(org)
+    response = check_dbt_files(org_mock)
 
-    mock_gather_dbt_project_params.assert_called_once_with(org, org.dbt)
+    mock_gather_dbt_project_params.assert_called_once_with(org_mock, org_mock.dbt)
 
     assert response == ("packages.yml" if settings.DEBUG else "packages.yml not found", None)
 
 
-@patch("ddpui.ddpdbt.elementary_service.DbtProjectManager.gather_dbt_project_params")
-@patch("ddpui.ddpdbt.elementary_service.Path")
+@patch.object(_es.DbtProjectManager, "gather_dbt_project_params")
+@patch.object(_es, "Path")
 def test_check_dbt_files_missing_dbt_project_yml(
     mock_path,
     mock_gather_dbt_project_params,
-    org,
+    org_mock,
 ):
     """tests check_dbt_files"""
-    mock_gather_dbt_project_params.retval = Mock(project_dir="test-project-dir")
+    mock_gather_dbt_project_params.return_value.project_dir = "test-project-dir"
 
     mock_dbt_project_yml = MagicMock()
     mock_dbt_project_yml.__str__.return_value = "dbt_project.yml"
@@ -281,26 +251,26 @@ def test_check_dbt_files_missing_dbt_project_yml(
     mock_dbt_project_yml.exists.return_value = False
     mock_packages_yml.exists.return_value = True
 
-    response = check_dbt_files(org)
+    response = check_dbt_files(org_mock)
 
-    mock_gather_dbt_project_params.assert_called_once_with(org, org.dbt)
+    mock_gather_dbt_project_params.assert_called_once_with(org_mock, org_mock.dbt)
 
     assert response == ("dbt_project.yml" if settings.DEBUG else "dbt_project.yml not found", None)
 
 
-@patch("ddpui.ddpdbt.elementary_service.DbtProjectManager.gather_dbt_project_params")
-@patch("ddpui.ddpdbt.elementary_service.get_elementary_package_version")
-@patch("ddpui.ddpdbt.elementary_service.get_elementary_target_schema")
-@patch("ddpui.ddpdbt.elementary_service.Path")
+@patch.object(_es.DbtProjectManager, "gather_dbt_project_params")
+@patch.object(_es, "get_elementary_package_version")
+@patch.object(_es, "get_elementary_target_schema")
+@patch.object(_es, "Path")
 def test_check_dbt_files_missing_elementary_package_missing_target_schema(
     mock_path,
     mock_get_elementary_target_schema,
     mock_get_elementary_package_version,
     mock_gather_dbt_project_params,
-    org,
+    org_mock,
 ):
     """tests check_dbt_files"""
-    mock_gather_dbt_project_params.retval = Mock(project_dir="test-project-dir")
+    mock_gather_dbt_project_params.return_value.project_dir = "test-project-dir"
 
     mock_dbt_project_yml = MagicMock()
     mock_dbt_project_yml.__str__.return_value = "dbt_project.yml"
@@ -319,10 +289,9 @@ def test_check_dbt_files_missing_elementary_package_missing_target_schema(
     mock_get_elementary_target_schema.return_value = None
     mock_get_elementary_package_version.return_value = None
 
-    response = check_dbt_files(org)
-    print("here31231231", response)
+    response = check_dbt_files(org_mock)
 
-    mock_gather_dbt_project_params.assert_called_once_with(org, org.dbt)
+    mock_gather_dbt_project_params.assert_called_once_with(org_mock, org_mock.dbt)
 
     assert response == (
         None,
@@ -336,19 +305,19 @@ def test_check_dbt_files_missing_elementary_package_missing_target_schema(
     )
 
 
-@patch("ddpui.ddpdbt.elementary_service.DbtProjectManager.gather_dbt_project_params")
-@patch("ddpui.ddpdbt.elementary_service.get_elementary_package_version")
-@patch("ddpui.ddpdbt.elementary_service.get_elementary_target_schema")
-@patch("ddpui.ddpdbt.elementary_service.Path")
+@patch.object(_es.DbtProjectManager, "gather_dbt_project_params")
+@patch.object(_es, "get_elementary_package_version")
+@patch.object(_es, "get_elementary_target_schema")
+@patch.object(_es, "Path")
 def test_check_dbt_files_have_elementary_package_missing_target_schema(
     mock_path,
     mock_get_elementary_target_schema,
     mock_get_elementary_package_version,
     mock_gather_dbt_project_params,
-    org,
+    org_mock,
 ):
     """tests check_dbt_files"""
-    mock_gather_dbt_project_params.retval = Mock(project_dir="test-project-dir")
+    mock_gather_dbt_project_params.return_value.project_dir = "test-project-dir"
 
     mock_dbt_project_yml = MagicMock()
     mock_dbt_project_yml.__str__.return_value = "dbt_project.yml"
@@ -367,9 +336,9 @@ def test_check_dbt_files_have_elementary_package_missing_target_schema(
     mock_get_elementary_target_schema.return_value = None
     mock_get_elementary_package_version.return_value = "100"
 
-    response = check_dbt_files(org)
+    response = check_dbt_files(org_mock)
 
-    mock_gather_dbt_project_params.assert_called_once_with(org, org.dbt)
+    mock_gather_dbt_project_params.assert_called_once_with(org_mock, org_mock.dbt)
 
     assert response == (
         None,
@@ -384,19 +353,19 @@ def test_check_dbt_files_have_elementary_package_missing_target_schema(
     )
 
 
-@patch("ddpui.ddpdbt.elementary_service.DbtProjectManager.gather_dbt_project_params")
-@patch("ddpui.ddpdbt.elementary_service.get_elementary_package_version")
-@patch("ddpui.ddpdbt.elementary_service.get_elementary_target_schema")
-@patch("ddpui.ddpdbt.elementary_service.Path")
+@patch.object(_es.DbtProjectManager, "gather_dbt_project_params")
+@patch.object(_es, "get_elementary_package_version")
+@patch.object(_es, "get_elementary_target_schema")
+@patch.object(_es, "Path")
 def test_check_dbt_files_missing_elementary_package_have_target_schema(
     mock_path,
     mock_get_elementary_target_schema,
     mock_get_elementary_package_version,
     mock_gather_dbt_project_params,
-    org,
+    org_mock,
 ):
     """tests check_dbt_files"""
-    mock_gather_dbt_project_params.retval = Mock(project_dir="test-project-dir")
+    mock_gather_dbt_project_params.return_value.project_dir = "test-project-dir"
 
     mock_dbt_project_yml = MagicMock()
     mock_dbt_project_yml.__str__.return_value = "dbt_project.yml"
@@ -415,9 +384,9 @@ def test_check_dbt_files_missing_elementary_package_have_target_schema(
     mock_get_elementary_target_schema.return_value = "100"
     mock_get_elementary_package_version.return_value = None
 
-    response = check_dbt_files(org)
+    response = check_dbt_files(org_mock)
 
-    mock_gather_dbt_project_params.assert_called_once_with(org, org.dbt)
+    mock_gather_dbt_project_params.assert_called_once_with(org_mock, org_mock.dbt)
 
     assert response == (
         None,
@@ -432,84 +401,35 @@ def test_check_dbt_files_missing_elementary_package_have_target_schema(
     )
 
 
-@patch("ddpui.ddpdbt.elementary_service.TaskProgress")
-@patch("ddpui.ddpdbt.elementary_service.uuid4")
-@patch("ddpui.ddpdbt.elementary_service.run_dbt_commands")
-def test_create_elementary_tracking_tables(
-    mock_run_dbt_commands, mock_uuid4, mock_task_progress, org
-):
+def test_create_elementary_tracking_tables(org_mock, dbt_task_mocks):
     """tests create_elementary_tracking_tables"""
-    mock_task_progress.return_value = Mock(add=Mock())
-    mock_uuid4.return_value = "test-uuid"
-    mock_run_dbt_commands.delay = Mock()
+    response = create_elementary_tracking_tables(org_mock)
 
-    response = create_elementary_tracking_tables(org)
     assert response == {
         "task_id": "test-uuid",
         "hashkey": f"{TaskProgressHashPrefix.RUNDBTCMDS.value}-test-org",
     }
 
-    mock_task_progress.assert_called_once_with("test-uuid", "run-dbt-commands-" + org.slug)
-    mock_run_dbt_commands.delay.assert_called_once_with(
-        org.id,
-        "test-uuid",
-        {
-            # run parameters
-            "options": {
-                "select": "elementary",
-            }
-        },
-    )
-
-
-def test_extract_profile_from_generate_elementary_cli_profile_failure():
-    """tests extract_profile_from_generate_elementary_cli_profile"""
-    profile = """
-bad_key:
-  target: test-target
-  schema: test-schema
-  table: test-table
-  columns: 
-    - col1
-    - col2
-""".split(
-        "\n"
-    )
-
-    error, _ = extract_profile_from_generate_elementary_cli_profile(profile)
-    assert error == {"error": "macro elementary.generate_elementary_cli_profile returned nothing"}
-
-
-def test_extract_profile_from_generate_elementary_cli_profile_success():
-    """tests extract_profile_from_generate_elementary_cli_profile"""
-    profile = """
-elementary:
-  target: test-target
-  schema: test-schema
-  table: test-table
-  columns: 
-    - col1
-    - col2
-""".split(
-        "\n"
-    )
-
-    _, result = extract_profile_from_generate_elementary_cli_profile(profile)
-    assert result == {
-        "elementary": {
-            "target": "test-target",
-            "schema": "test-schema",
-            "table": "test-table",
-            "columns": ["col1", "col2"],
-        }
-    }
+    assert dbt_task_mocks.task_progress.mock_calls == [
+        call("test-uuid", "run-dbt-commands-test-org"),
+        call().add({"message": "Added dbt commands in queue", "status": "queued"}),
+    ]
+    assert dbt_task_mocks.run_dbt_commands.mock_calls == [
+        call.delay(
+            org_mock.id,
+            "test-uuid",
+            {
+                # run parameters
+                "options": {
+                    "select": "elementary",
+                }
+            },
+        )
+    ]
 
 
-@patch("ddpui.ddpdbt.elementary_service.prefect_service.lock_tasks_for_deployment")
-@patch("ddpui.ddpdbt.elementary_service.prefect_service.create_deployment_flow_run")
-def test_refresh_elementary_report_via_prefect(
-    mock_create_deployment_flow_run, mock_lock_tasks_for_deployment, orguser, orgtask
-):
+@pytest.mark.django_db
+def test_refresh_elementary_report_via_prefect(orguser, orgtask):
     """tests refresh_elementary_report_via_prefect"""
     odf = OrgDataFlowv1.objects.create(
         org=orguser.org,
@@ -519,87 +439,77 @@ def test_refresh_elementary_report_via_prefect(
         dataflow_type="manual",  # we dont want it to show in flows/pipelines page
         cron="0 0 * * *",
     )
-
-    mock_lock_tasks_for_deployment.return_value = []
-    mock_create_deployment_flow_run.return_value = "return-value"
-
     DataflowOrgTask.objects.create(orgtask=orgtask, dataflow=odf)
 
-    response = refresh_elementary_report_via_prefect(orguser)
-    assert response == "return-value"
+    # one parent mock, so that the order of the two calls is checked too
+    prefect = Mock()
+    prefect.lock_tasks_for_deployment.return_value = []
+    prefect.create_deployment_flow_run.return_value = "return-value"
+    with patch.multiple(
+        _es.prefect_service,
+        lock_tasks_for_deployment=prefect.lock_tasks_for_deployment,
+        create_deployment_flow_run=prefect.create_deployment_flow_run,
+    ):
+        response = refresh_elementary_report_via_prefect(orguser)
 
-    mock_lock_tasks_for_deployment.assert_called_once_with("test-deployment-id", orguser)
-    mock_create_deployment_flow_run.assert_called_once_with(odf.deployment_id)
+    assert response == "return-value"
+    assert prefect.mock_calls == [
+        call.lock_tasks_for_deployment("test-deployment-id", orguser),
+        call.create_deployment_flow_run("test-deployment-id"),
+    ]
 
     odf.delete()
 
 
-@patch("ddpui.ddpdbt.elementary_service.DbtProjectManager.gather_dbt_project_params")
-@patch("ddpui.ddpdbt.elementary_service.subprocess.check_output")
-def test_get_dbt_version_success(mock_check_output, mock_gather_dbt_project_params, org):
-    """tests get_dbt_version"""
-    mock_gather_dbt_project_params.return_value = Mock(dbt_binary="test-binary")
-    mock_check_output.return_value = "line1\nline2\ninstalled: 0.19.0\nline4"
+def test_parse_dbt_version():
+    """tests parse_dbt_version"""
+    assert parse_dbt_version("line1\nline2\ninstalled: 0.19.0\nline4") == "0.19.0"
 
-    response = get_dbt_version(org)
 
-    mock_gather_dbt_project_params.assert_called_once_with(org, org.dbt)
-    mock_check_output.assert_called_once_with(["test-binary", "--version"], text=True)
-
-    assert response == "0.19.0"
-
-
-@patch("ddpui.ddpdbt.elementary_service.DbtProjectManager.gather_dbt_project_params")
-@patch("ddpui.ddpdbt.elementary_service.subprocess.check_output")
-def test_get_dbt_version_failure(mock_check_output, mock_gather_dbt_project_params, org):
-    """tests get_dbt_version"""
-    mock_gather_dbt_project_params.return_value = Mock(dbt_binary="test-binary")
-    mock_check_output.return_value = "line1\nline2\nline3\nline4"
+def test_parse_dbt_version_not_found():
+    """tests parse_dbt_version"""
+    assert parse_dbt_version("line1\nline2\nline3\nline4") == "Not available"
 
-    response = get_dbt_version(org)
 
-    mock_gather_dbt_project_params.assert_called_once_with(org, org.dbt)
-    mock_check_output.assert_called_once_with(["test-binary", "--version"], text=True)
-
-    assert response == "Not available"
+def test_parse_edr_version():
+    """tests parse_edr_version"""
+    assert parse_edr_version("line1\nline2\nElementary version is 1.\nline4") == "1"
 
 
-@patch("ddpui.ddpdbt.elementary_service.DbtProjectManager.gather_dbt_project_params")
-@patch("ddpui.ddpdbt.elementary_service.subprocess.check_output")
-def test_get_edr_version_failure(mock_check_output, mock_gather_dbt_project_params, org):
-    """tests get_edr_version"""
-    mock_gather_dbt_project_params.return_value = Mock(venv_binary="venv/bin")
-    mock_check_output.return_value = "line1\nline2\nline3\nline4"
+def test_parse_edr_version_not_found():
+    """tests parse_edr_version"""
+    assert parse_edr_version("line1\nline2\nline3\nline4") == "Not available"
 
-    response = get_edr_version(org)
-
-    mock_gather_dbt_project_params.assert_called_once_with(org, org.dbt)
 
-    mock_check_output.assert_called_once_with(["venv/bin/edr", "--version"], text=True)
-
-    assert response == "Not available"
+@patch.object(_es.DbtProjectManager, "gather_dbt_project_params")
+@patch.object(_es, "runcmd_async")
+def test_get_dbt_and_edr_versions(mock_runcmd_async, mock_gather_dbt_project_params, org_mock):
+    """tests get_dbt_and_edr_versions"""
+    mock_gather_dbt_project_params.return_value = Mock(
+        dbt_binary="test-binary", venv_binary="venv/bin"
+    )
 
+    async def runcmd_async(cmd):
+        if cmd[0] == "test-binary":
+            return "line1\ninstalled: 0.19.0\nline3"
+        raise Exception("edr not installed")
 
-@patch("ddpui.ddpdbt.elementary_service.DbtProjectManager.gather_dbt_project_params")
-@patch("ddpui.ddpdbt.elementary_service.subprocess.check_output")
-def test_get_edr_version_success(mock_check_output, mock_gather_dbt_project_params, org):
-    """tests get_edr_version"""
-    mock_gather_dbt_project_params.return_value = Mock(venv_binary="venv/bin")
-    mock_check_output.return_value = "line1\nline2\nElementary version is 1.\nline4"
+    mock_runcmd_async.side_effect = runcmd_async
 
-    response = get_edr_version(org)
+    response = get_dbt_and_edr_versions(org_mock)
 
-    mock_gather_dbt_project_params.assert_called_once_with(org, org.dbt)
+    mock_gather_dbt_project_params.assert_called_once_with(org_mock, org_mock.dbt)
+    mock_runcmd_async.assert_any_call(["test-binary", "--version"])
+    mock_runcmd_async.assert_any_call(["venv/bin/edr", "--version"])
 
-    mock_check_output.assert_called_once_with(["venv/bin/edr", "--version"], text=True)
+    assert response == ("0.19.0", "Not available")
 
-    assert response == "1"
 
-
-@patch("ddpui.ddpdbt.elementary_service.DbtProjectManager.gather_dbt_project_params")
-@patch("ddpui.ddpdbt.elementary_service.setup_edr_send_report_task_config")
-@patch("ddpui.ddpdbt.elementary_service.generate_hash_id")
-@patch("ddpui.ddpdbt.elementary_service.prefect_service.create_dataflow_v1")
+@pytest.mark.django_db
+@patch.object(_es.DbtProjectManager, "gather_dbt_project_params")
+@patch.object(_es, "setup_edr_send_report_task_config")
+@patch.object(_es, "generate_hash_id")
+@patch.object(_es.prefect_service, "create_dataflow_v1")
 def test_create_edr_sendreport_dataflow(
     mock_create_dataflow_v1,
     mock_generate_hash_id,
@@ -614,16 +524,12 @@ def test_create_edr_sendreport_dataflow(
     mock_gather_dbt_project_params.return_value = Mock(
         venv_binary="venv/bin", project_dir="project-dir"
     )
-    mock_setup_edr_send_report_task_config.return_value = Mock(
-        to_json=Mock(return_value={"task": "config"})
-    )
+    mock_setup_edr_send_report_task_config.return_value.to_json.return_value = {"task": "config"}
     mock_generate_hash_id.return_value = "hashcode"
 
-    deployment_name = f"pipeline-{org.slug}-generate-edr-hashcode"
-
     mock_create_dataflow_v1.return_value = {
         "deployment": {
-            "name": deployment_name,
+            "name": EDR_DEPLOYMENT_NAME,
             "id": "deployment-id",
         }
     }
@@ -638,8 +544,8 @@ def test_create_edr_sendreport_dataflow(
 
     mock_create_dataflow_v1.assert_called_once_with(
         PrefectDataFlowCreateSchema3(
-            deployment_name=deployment_name,
-            flow_name=deployment_name,
+            deployment_name=EDR_DEPLOYMENT_NAME,
+            flow_name=EDR_DEPLOYMENT_NAME,
             orgslug=org.slug,
             deployment_params={
                 "config": {
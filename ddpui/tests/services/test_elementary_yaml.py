@@ -0,0 +1,146 @@
+import io
+from typing import Final
+from unittest.mock import patch, Mock
+import pytest
+from ddpui.ddpdbt import elementary_service as _es
+from ddpui.ddpdbt.elementary_service import (
+    get_elementary_target_schema,
+    get_elementary_package_version,
+    extract_profile_from_generate_elementary_cli_profile,
+)
+
+# yaml inputs for the dbt_project.yml and packages.yml parsers
+SCHEMA_YAML: Final = """
+    models:
+      elementary:
+        schema: elementary
+    """
+PLUS_SCHEMA_YAML: Final = """
+    models:
+      elementary:
+        +schema: elementary
+    """
+NOT_ELEMENTARY_YAML: Final = """
+    models:
+      not_elementary:
+        schema: not_elementary
+    """
+NO_SCHEMA_YAML: Final = """
+    models:
+      elementary:
+        other_key: other_value
+    """
+PACKAGES_YAML: Final = """
+    packages:
+      - package: elementary-data/elementary
+        version: 0.15.2
+    """
+OTHER_PACKAGES_YAML: Final = """
+    packages:
+      - package: other-package
+        version: 1.0.0
+    """
+NO_PACKAGES_KEY_YAML: Final = """
+    other_key:
+      - package: elementary-data/elementary
+        version: 0.15.2
+    """
+
+# output lines of the elementary.generate_elementary_cli_profile macro, as from splitlines()
+BAD_PROFILE_LINES: Final = (
+    "",
+    "bad_key:",
+    "  target: test-target",
+    "  schema: test-schema",
+    "  table: test-table",
+    "  columns: ",
+    "    - col1",
+    "    - col2",
+)
+GOOD_PROFILE_LINES: Final = (
+    "",
+    "elementary:",
+    "  target: test-target",
+    "  schema: test-schema",
+    "  table: test-table",
+    "  columns: ",
+    "    - col1",
+    "    - col2",
+)
+
+
+def open_str(content: str):
+    """a replacement for builtins.open which reads `content`, whatever the file"""
+    return lambda *args, **kwargs: io.StringIO(content)
+
+
+@pytest.fixture
+def yaml_mtime():
+    """patches getmtime for the yaml parsers, since the files they are given don't exist"""
+    with patch.object(_es.os.path, "getmtime", return_value=0.0) as getmtime:
+        yield getmtime
+
+
+@pytest.mark.parametrize(
+    "dbt_project_content,expected",
+    [
+        (SCHEMA_YAML, {"schema": "elementary"}),
+        (PLUS_SCHEMA_YAML, {"+schema": "elementary"}),
+        (NOT_ELEMENTARY_YAML, None),
+        (NO_SCHEMA_YAML, None),
+    ],
+    ids=["schema", "plus_schema", "no_elementary", "no_schema"],
+)
+def test_get_elementary_target_schema(dbt_project_content, expected, yaml_mtime):
+    """tests get_elementary_target_schema"""
+    with patch("builtins.open", open_str(dbt_project_content)):
+        result = get_elementary_target_schema("dbt_project.yml")
+        assert result == expected
+
+
+@pytest.mark.parametrize(
+    "packages_content,expected",
+    [
+        (PACKAGES_YAML, {"package": "elementary-data/elementary", "version": "0.15.2"}),
+        (OTHER_PACKAGES_YAML, None),
+        (NO_PACKAGES_KEY_YAML, None),
+        ("", None),
+    ],
+    ids=["found", "not_found", "no_packages_key", "empty_file"],
+)
+def test_get_elementary_package_version(packages_content, expected, yaml_mtime):
+    """tests get_elementary_package_version"""
+    with patch("builtins.open", open_str(packages_content)):
+        result = get_elementary_package_version("packages.yml")
+        assert result == expected
+
+
+def test_parse_yaml_cached_rereads_modified_file(yaml_mtime):
+    """the file is parsed again only when its mtime changes"""
+    with patch("builtins.open", Mock(side_effect=open_str(PACKAGES_YAML))) as mock_open:
+        get_elementary_package_version("packages.yml")
+        get_elementary_package_version("packages.yml")
+        assert mock_open.call_count == 1
+
+        yaml_mtime.return_value = 1.0
+        get_elementary_package_version("packages.yml")
+        assert mock_open.call_count == 2
+
+
+def test_extract_profile_from_generate_elementary_cli_profile_failure():
+    """tests extract_profile_from_generate_elementary_cli_profile"""
+    error, _ = extract_profile_from_generate_elementary_cli_profile(BAD_PROFILE_LINES)
+    assert error == {"error": "macro elementary.generate_elementary_cli_profile returned nothing"}
+
+
+def test_extract_profile_from_generate_elementary_cli_profile_success():
+    """tests extract_profile_from_generate_elementary_cli_profile"""
+    _, result = extract_profile_from_generate_elementary_cli_profile(GOOD_PROFILE_LINES)
+    assert result == {
+        "elementary": {
+            "target": "test-target",
+            "schema": "test-schema",
+            "table": "test-table",
+            "columns": ["col1", "col2"],
+        }
+    }
@@ -0,0 +1,37 @@
+import logging
+from unittest.mock import Mock, patch
+
+from ddpui.utils.custom_logger import CustomLogger
+
+
+def test_log_extras(caplog):
+    """the caller's name and the org slug of the orguser in scope are logged"""
+    logger = CustomLogger("ddpui-pytest-logger")
+    orguser = Mock()  # pylint: disable=unused-variable
+    orguser.org.slug = "org-slug"
+    with caplog.at_level(logging.INFO, logger="ddpui-pytest-logger"):
+        logger.info("message %s", "arg")
+    record = caplog.records[-1]
+    assert record.getMessage() == "message arg"
+    assert record.caller_name == "test_log_extras"
+    assert record.orgname == "org-slug"
+
+
+def test_disabled_level_is_skipped():
+    """nothing is computed for a level which is not enabled"""
+    logger = CustomLogger("ddpui-pytest-logger")
+    with patch.object(logger, "get_slug") as get_slug_mock:
+        logger.debug("message %s", {"large": "dict"})
+    get_slug_mock.assert_not_called()
+
+
+def test_exception_includes_traceback(caplog):
+    """logger.exception logs at error level with exc_info"""
+    logger = CustomLogger("ddpui-pytest-logger")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed")
+    record = caplog.records[-1]
+    assert record.levelno == logging.ERROR
+    assert record.exc_info[0] is ValueError
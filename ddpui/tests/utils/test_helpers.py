@@ -1,5 +1,8 @@
+import asyncio
+import subprocess
 from datetime import datetime, time
 import pytz
+import pytest
 
 from ddpui.utils.helpers import (
     remove_nested_attribute,
@@ -11,6 +14,7 @@ from ddpui.utils.helpers import (
     nice_bytes,
     get_schedule_time_for_large_jobs,
     find_key_in_dictionary,
+    runcmd_async,
 )
 
 
@@ -264,3 +268,11 @@ def test_find_key_in_dictionary():
     assert find_key_in_dictionary({"a": {"b": "c"}}, "b") == "c"
     assert find_key_in_dictionary({"a": {"b": {"c": "d"}}}, "c") == "d"
     assert find_key_in_dictionary({"a": {"b": {"c": "d"}}}, "d") is None
+
+
+def test_runcmd_async():
+    """tests runcmd_async"""
+    assert asyncio.run(runcmd_async(["echo", "hello"])) == "hello\n"
+
+    with pytest.raises(subprocess.CalledProcessError):
+        asyncio.run(runcmd_async(["false"]))
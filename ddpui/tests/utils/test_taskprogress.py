@@ -0,0 +1,39 @@
+import json
+from unittest.mock import patch, Mock
+
+from ddpui.utils.taskprogress import TaskProgress
+
+
+def make_taskprogress(expire_in_seconds=None):
+    """a TaskProgress with a mocked redis"""
+    redis = Mock()
+    with patch("ddpui.utils.taskprogress.RedisClient.get_instance", return_value=redis):
+        taskprogress = TaskProgress("task-id", "hashkey", expire_in_seconds)
+    return taskprogress, redis.pipeline.return_value
+
+
+def test_add_writes_immediately():
+    """each add is written to redis, the expiry is set once"""
+    taskprogress, pipeline = make_taskprogress(60)
+    taskprogress.add({"message": "m1", "status": "running"})
+    taskprogress.add({"message": "m2", "status": "running"})
+
+    assert pipeline.execute.call_count == 2
+    pipeline.expire.assert_called_once_with("hashkey", 60)
+    pipeline.hset.assert_called_with(
+        "hashkey",
+        "task-id",
+        json.dumps(
+            [{"message": "m1", "status": "running"}, {"message": "m2", "status": "running"}]
+        ),
+    )
+
+
+def test_add_many_writes_once():
+    """add_many writes all its entries in one go"""
+    taskprogress, pipeline = make_taskprogress()
+    taskprogress.add_many([{"message": f"m{i}", "status": "running"} for i in range(10)])
+
+    pipeline.hset.assert_called_once()
+    pipeline.expire.assert_not_called()
+    assert len(taskprogress.taskprogress) == 10
@@ -0,0 +1,43 @@
+from unittest.mock import Mock, patch
+
+from ddpui.utils.ttlcache import ttl_cache
+
+
+def test_ttl_cache_hit_and_expiry():
+    """the cached value is returned until it expires"""
+    func = Mock(side_effect=lambda x: x * 2)
+    cached = ttl_cache(10)(func)
+
+    with patch("ddpui.utils.ttlcache.time.monotonic", return_value=100):
+        assert cached(1) == 2
+        assert cached(1) == 2
+        assert cached(2) == 4
+    assert func.call_count == 2
+
+    with patch("ddpui.utils.ttlcache.time.monotonic", return_value=111):
+        assert cached(1) == 2
+    assert func.call_count == 3
+
+
+def test_ttl_cache_key():
+    """a custom key decides which calls share an entry"""
+    func = Mock(return_value="value")
+    cached = ttl_cache(10, key=lambda obj, arg: (obj.workspace, arg))(func)
+
+    assert cached(Mock(workspace="ws"), "a") == "value"
+    assert cached(Mock(workspace="ws"), "a") == "value"
+    assert func.call_count == 1
+
+    cached(Mock(workspace="another-ws"), "a")
+    assert func.call_count == 2
+
+
+def test_ttl_cache_clear():
+    """cache_clear empties the cache"""
+    func = Mock(return_value="value")
+    cached = ttl_cache(10)(func)
+
+    cached()
+    cached.cache_clear()
+    cached()
+    assert func.call_count == 2
@@ -12,42 +12,44 @@ class CustomLogger:
     def get_slug(self):
         """retrieve the org.slug from the request"""
         try:
-            stack = inspect.stack()
-            for frame_info in stack:
-                frame = frame_info.frame
+            # walk the frames directly; inspect.stack() would read source lines for each of them
+            frame = inspect.currentframe()
+            while frame is not None:
                 userorg = frame.f_locals.get("orguser")
                 if userorg is not None and userorg.org is not None:
                     return userorg.org.slug
+                frame = frame.f_back
         except Exception as error:
             self.logger.error("An error occurred while getting slug: %s", str(error))
         return ""
 
+    def _log(self, level, args, exc_info=False):
+        """log with the caller_name and the orgname, if this level is enabled"""
+        if not self.logger.isEnabledFor(level):
+            return
+        slug = self.get_slug()
+        # our caller is info / error / ..., theirs is the function which is logging
+        caller_name = inspect.currentframe().f_back.f_back.f_code.co_name
+        self.logger.log(
+            level, *args, exc_info=exc_info, extra={"caller_name": caller_name, "orgname": slug}
+        )
+
     def info(self, *args):
         """call logger.info with the caller_name and the orgname"""
-        slug = self.get_slug()
-        caller_name = inspect.stack()[1].function
-        self.logger.info(*args, extra={"caller_name": caller_name, "orgname": slug})
+        self._log(logging.INFO, args)
 
     def error(self, *args):
         """call logger.error with the caller_name and the orgname"""
-        slug = self.get_slug()
-        caller_name = inspect.stack()[1].function
-        self.logger.error(*args, extra={"caller_name": caller_name, "orgname": slug})
+        self._log(logging.ERROR, args)
 
     def debug(self, *args):
         """call logger.debug with the caller_name and the orgname"""
-        slug = self.get_slug()
-        caller_name = inspect.stack()[1].function
-        self.logger.debug(*args, extra={"caller_name": caller_name, "orgname": slug})
+        self._log(logging.DEBUG, args)
 
     def exception(self, *args):
         """call logger.exception with the caller_name and the orgname"""
-        slug = self.get_slug()
-        caller_name = inspect.stack()[1].function
-        self.logger.exception(*args, extra={"caller_name": caller_name, "orgname": slug})
+        self._log(logging.ERROR, args, exc_info=True)
 
     def warning(self, *args):
         """call logger.warning with the caller_name and the orgname"""
-        slug = self.get_slug()
-        caller_name = inspect.stack()[1].function
-        self.logger.warning(*args, extra={"caller_name": caller_name, "orgname": slug})
+        self._log(logging.WARNING, args)
@@ -1,4 +1,5 @@
 import shlex
+import asyncio
 import calendar
 import subprocess
 import re
@@ -24,6 +25,25 @@ def runcmd_with_output(cmd, cwd):
     return subprocess.run(shlex.split(cmd), cwd=str(cwd), capture_output=True)
 
 
+async def runcmd_async(cmd: list, cwd: str | None = None) -> str:
+    """
+    runs a command without blocking the event loop and returns its stdout,
+    so that several commands can be awaited concurrently
+    raises CalledProcessError if the command fails
+    """
+    cmd = [str(arg) for arg in cmd]
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=str(cwd) if cwd else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd, stdout, stderr)
+    return stdout.decode("utf-8")
+
+
 def remove_nested_attribute(obj: dict, attr: str) -> dict:
     """
     this function searches for `attr` in the JSON object
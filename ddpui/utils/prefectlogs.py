@@ -401,7 +401,7 @@ def parse_prefect_logs(connection_info: dict, flow_run_id: str):
     for message in messages:
         # some task types are just skipped
         if message["task_name"] == "trigger-0":
-            logger.debug(f"skipping task: {message['task_name']}")
+            logger.debug("skipping task: %s", message["task_name"])
             continue
 
         # rename to more descriptive task names
@@ -416,7 +416,7 @@ def parse_prefect_logs(connection_info: dict, flow_run_id: str):
                 result.append(task_summary)
             last_task_name = message["task_name"]
             task_summary = {"task_name": message["task_name"], "log_lines": []}
-            logger.debug(f"new task: {message['task_name']}")
+            logger.debug("new task: %s", message["task_name"])
 
         # some log lines are multiline
         lines = message["message"].split("\n")
@@ -443,7 +443,10 @@ def parse_prefect_logs(connection_info: dict, flow_run_id: str):
                     match = parse_airbyte_wait_for_completion_log(line)
                     if match:
                         logger.debug(
-                            f"[{message['task_name']}] [{message['state_name']}] {match['pattern']}"
+                            "[%s] [%s] %s",
+                            message["task_name"],
+                            message["state_name"],
+                            match["pattern"],
                         )
                         task_summary.update(match)
                 else:
@@ -455,7 +458,7 @@ def parse_prefect_logs(connection_info: dict, flow_run_id: str):
                 match = parse_git_pull_log(line)
                 if match:
                     if match["pattern"] == "already-up-to-date":
-                        logger.debug(f"[{message['task_name']}] {match['pattern']}")
+                        logger.debug("[%s] %s", message["task_name"], match["pattern"])
                         task_summary.update(match)
                     # ignore other matches
                 else:
@@ -467,7 +470,7 @@ def parse_prefect_logs(connection_info: dict, flow_run_id: str):
                 match = parse_dbt_clean_log(line)
                 if match:
                     if match["pattern"] == "cleaned-all-paths":
-                        logger.debug(f"[{message['task_name']}] {match['pattern']}")
+                        logger.debug("[%s] %s", message["task_name"], match["pattern"])
                         task_summary.update(match)
                     # ignore other matches
                 else:
@@ -479,7 +482,7 @@ def parse_prefect_logs(connection_info: dict, flow_run_id: str):
                 match = parse_dbt_deps_log(line)
                 if match:
                     if match["pattern"] == "installed-package":
-                        logger.debug(f"[{message['task_name']}] {match['pattern']}")
+                        logger.debug("[%s] %s", message["task_name"], match["pattern"])
                         task_summary.update(match)
                     # ignore other matches
                 else:
@@ -491,7 +494,7 @@ def parse_prefect_logs(connection_info: dict, flow_run_id: str):
                 match = parse_dbt_run_log(line)
                 if match:
                     if match["pattern"] == "run-summary":
-                        logger.debug(f"[{message['task_name']}] {match['pattern']}")
+                        logger.debug("[%s] %s", message["task_name"], match["pattern"])
                         task_summary.update(match)
                     # ignore all matches
                 else:
@@ -504,7 +507,10 @@ def parse_prefect_logs(connection_info: dict, flow_run_id: str):
                 if match:
                     if match["pattern"] == "failure-in-test":
                         logger.debug(
-                            f"[{message['task_name']}] => test failed for model {match['model']} in file {match['file']}"
+                            "[%s] => test failed for model %s in file %s",
+                            message["task_name"],
+                            match["model"],
+                            match["file"],
                         )
                         task_summary["status"] = "failed"
                         task_summary["tests"] = [match]
@@ -513,7 +519,7 @@ def parse_prefect_logs(connection_info: dict, flow_run_id: str):
                         # result.append(task_summary)
 
                     elif match["pattern"] == "test-summary":
-                        logger.debug(f"[{message['task_name']}] {match['pattern']}")
+                        logger.debug("[%s] %s", message["task_name"], match["pattern"])
                         task_summary["tests"].append(match)
                         if task_summary.get("status") != "failed":
                             task_summary["status"] = "success"
@@ -23,11 +23,21 @@ class TaskProgress:
     def add(self, progress) -> None:
         """append the latest progress to the list and update in redis"""
         self.taskprogress.append(progress)
-        self.redis.hset(self.hashkey, self.task_id, json.dumps(self.taskprogress))
-        if not self.expiration_set:
-            if self.expire_in_seconds:
-                self.redis.expire(self.hashkey, self.expire_in_seconds)
-            self.expiration_set = True
+        self.flush()
+
+    def add_many(self, progresses: list) -> None:
+        """append several progress entries and update in redis once"""
+        self.taskprogress.extend(progresses)
+        self.flush()
+
+    def flush(self) -> None:
+        """write the list to redis"""
+        pipeline = self.redis.pipeline()
+        pipeline.hset(self.hashkey, self.task_id, json.dumps(self.taskprogress))
+        if not self.expiration_set and self.expire_in_seconds:
+            pipeline.expire(self.hashkey, self.expire_in_seconds)
+        pipeline.execute()
+        self.expiration_set = True
 
     def remove(self) -> None:
         """removes the hash from redis"""
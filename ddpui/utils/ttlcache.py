@@ -0,0 +1,47 @@
+"""a small in-process cache whose entries expire after a fixed number of seconds"""
+
+import threading
+import time
+from functools import wraps
+
+
+def ttl_cache(ttl: int, key=None):
+    """
+    caches the return value of the decorated function for `ttl` seconds
+    the cache key is `key(*args, **kwargs)` if `key` is provided, else the arguments themselves
+    the decorated function gets a `cache_clear()` to empty its cache
+    """
+
+    def decorator(func):
+        cache = {}
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if key:
+                cache_key = key(*args, **kwargs)
+            else:
+                cache_key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(cache_key)
+            if entry is not None and entry[1] > now:
+                return entry[0]
+
+            value = func(*args, **kwargs)
+
+            with lock:
+                # drop expired entries so that the cache doesn't grow without bound
+                for expired_key in [k for k, (_, expiry) in cache.items() if expiry <= now]:
+                    del cache[expired_key]
+                cache[cache_key] = (value, now + ttl)
+            return value
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator